@@ -12,7 +12,7 @@ import pandas as pd
 import requests
 import streamlit as st
 
-from utils.gisaid_parser import decompress_if_needed, parse_gisaid_fasta
+from utils.gisaid_parser import content_digest, decompress_if_needed, parse_gisaid_fasta
 from utils.minimal_i18n import T
 
 # Size thresholds (bytes)
@@ -75,12 +75,15 @@ if uploaded_files:
                     st.error(T("upload_zip_no_fasta", fname=uf.name))
                     continue
                 _zip_added = 0
+                _zip_key = content_digest(raw_bytes)
                 for _member_path, _member_content in _zip_members.items():
                     _short = _pl.Path(_member_path).name  # strip internal folder
                     if _short in existing_names:
                         continue
-                    _parsed, _pt = parse_gisaid_fasta(_member_content, _short)
-                    if not _parsed:
+                    _parsed, _pt = parse_gisaid_fasta(
+                        _member_content, _short, f"{_zip_key}:{_member_path}"
+                    )
+                    if _parsed.empty:
                         continue
                     st.session_state["raw_files"].append({
                         "name":        _short,
@@ -102,9 +105,11 @@ if uploaded_files:
                 continue  # Skip single-file path below
             # ── Single FASTA / .gz ────────────────────────────────────────────────
             content = decompress_if_needed(raw_bytes, uf.name)
-            parsed_list, parse_time = parse_gisaid_fasta(content, uf.name)
+            parsed_list, parse_time = parse_gisaid_fasta(
+                content, uf.name, content_digest(raw_bytes)
+            )
 
-        if not parsed_list:
+        if parsed_list.empty:
             st.error(f"No sequences found in `{uf.name}`. Check the file format.")
             continue
 
@@ -229,7 +234,8 @@ else:
             ]
             with st.spinner(T("workspace_building_df")):
                 dfs = [pd.DataFrame(p) for p in selected_parsed]
-                merged = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+                # copy() so the active frame never shares data with raw_files
+                merged = pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0].copy()
 
             # THE ONLY PLACE active_df IS WRITTEN
             st.session_state["active_df"] = merged
@@ -342,8 +348,10 @@ if not active_df.empty:
                         r.raise_for_status()
                         fname = url.split("/")[-1].split("?")[0] or "downloaded.fasta"
                         content = decompress_if_needed(r.content, fname)
-                        parsed_list, parse_time = parse_gisaid_fasta(content, fname)
-                    if parsed_list:
+                        parsed_list, parse_time = parse_gisaid_fasta(
+                            content, fname, content_digest(r.content)
+                        )
+                    if not parsed_list.empty:
                         st.session_state["raw_files"].append({
                             "name":        fname,
                             "parsed":      parsed_list,
@@ -379,8 +387,10 @@ if COLAB_AVAILABLE:
                     raw_bytes = f.read()
                 fname = drive_path.split("/")[-1]
                 content = decompress_if_needed(raw_bytes, fname)
-                parsed_list, parse_time = parse_gisaid_fasta(content, fname)
-                if parsed_list:
+                parsed_list, parse_time = parse_gisaid_fasta(
+                    content, fname, content_digest(raw_bytes)
+                )
+                if not parsed_list.empty:
                     st.session_state["raw_files"].append({
                         "name":        fname,
                         "parsed":      parsed_list,
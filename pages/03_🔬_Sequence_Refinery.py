@@ -10,6 +10,7 @@ CRITICAL STATE RULE:
 
 import json
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -423,15 +424,7 @@ with st.expander(f"🧠 {T('hitl_header')}"):
                          disabled=not selected_periods, use_container_width=True):
                 st.session_state["selected_peaks"] = selected_periods
                 with st.spinner(T("hitl_sampling")):
-                    df_work = current.copy()
-                    df_work["_period"] = (
-                        pd.to_datetime(df_work["collection_date"], errors="coerce")
-                        .dt.to_period("W").astype(str)
-                    )
-                    result = (
-                        df_work[df_work["_period"].isin(selected_periods)]
-                        .drop(columns=["_period"])
-                    )
+                    result = detector.select_weeks(current, selected_periods)
                 _save_filtered(result, "peak_checklist_sampling")
                 st.success(
                     f"Checklist sampling — {len(result):,} sequences from "
@@ -506,15 +499,7 @@ with st.expander(f"🧠 {T('hitl_header')}"):
                     )
                     if st.button(T("hitl_apply_lasso"), type="primary",
                                  use_container_width=True):
-                        df_work = current.copy()
-                        df_work["_period"] = (
-                            pd.to_datetime(df_work["collection_date"], errors="coerce")
-                            .dt.to_period("W").astype(str)
-                        )
-                        result = (
-                            df_work[df_work["_period"].isin(selected_periods)]
-                            .drop(columns=["_period"])
-                        )
+                        result = detector.select_weeks(current, selected_periods)
                         _save_filtered(result, "lasso_sampling")
                         st.success(
                             f"Lasso sampling — {len(result):,} sequences "
@@ -569,16 +554,22 @@ with st.expander(f"🧠 {T('hitl_header')}"):
             ]
             st.session_state["checkpoint_targets"] = [str(c) for c in checkpoints]
 
-            df_work = current.copy()
-            dates = pd.to_datetime(df_work["collection_date"], errors="coerce")
-
-            selected_idx = set()
-            for cp in checkpoints:
-                diff = (dates - cp).abs()
-                in_window = diff[diff <= tol].index
-                selected_idx.update(in_window.tolist())
-
-            result = df_work.loc[sorted(selected_idx)]
+            dates = pd.to_datetime(current["collection_date"], errors="coerce")
+
+            # Sort once, then binary-search each checkpoint's ±tol window
+            # rather than scanning the whole column per checkpoint.
+            # NaT views as the minimum int64, below every window.
+            ns = dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            order = np.argsort(ns, kind="stable")
+            ns_sorted = ns[order]
+            cp_ns = np.array([cp.value for cp in checkpoints], dtype=np.int64)
+            lo = np.searchsorted(ns_sorted, cp_ns - tol.value, side="left")
+            hi = np.searchsorted(ns_sorted, cp_ns + tol.value, side="right")
+            selected = np.zeros(len(current), dtype=bool)
+            for start, stop in zip(lo, hi):
+                selected[order[start:stop]] = True
+
+            result = current[selected].sort_index()
             _save_filtered(result, "checkpoint_sampling")
             st.success(
                 f"Checkpoint sampling — {len(result):,} sequences "
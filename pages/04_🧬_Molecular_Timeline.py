@@ -18,13 +18,13 @@ Architecture follows Molecular_Timeline_Tracker_Architecture_Plan.docx:
   Phase 4: Impact Preview & Export
 """
 
-import hashlib
 import json
 from datetime import datetime
 
 import pandas as pd
 import streamlit as st
 
+from utils.gisaid_parser import compute_sequence_hash, convert_df_to_fasta_bytes
 from utils.minimal_i18n import T
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -112,7 +112,7 @@ if len(_tl_contrib) > 1:
             _display_df["sequence_hash"] = (
                 _display_df["sequence"]
                 .fillna("")
-                .apply(lambda s: hashlib.md5(s.upper().encode()).hexdigest()[:12])
+                .str.upper().map(compute_sequence_hash)
             )
         _mode_badge = f"📁 {_scope_choices[0][:30]}"
         st.success(T("timeline_scope_file_badge",
@@ -131,7 +131,7 @@ if len(_tl_contrib) > 1:
             if "sequence_hash" not in _display_df.columns and "sequence" in _display_df.columns:
                 _display_df["sequence_hash"] = (
                     _display_df["sequence"].fillna("")
-                    .apply(lambda s: hashlib.md5(s.upper().encode()).hexdigest()[:12])
+                    .str.upper().map(compute_sequence_hash)
                 )
         st.info(T("timeline_scope_batch_info", n=len(_scope_choices)))
 
@@ -217,7 +217,7 @@ if "sequence_hash" not in _display_df.columns and "sequence" in _display_df.colu
     _display_df["sequence_hash"] = (
         _display_df["sequence"]
         .fillna("")
-        .apply(lambda s: hashlib.md5(s.upper().encode()).hexdigest()[:12])
+        .str.upper().map(compute_sequence_hash)
     )
 
 if "sequence_hash" not in _display_df.columns:
@@ -1413,16 +1413,7 @@ with st.expander(f"🔬 {T('timeline_preview_header')}", expanded=True):
         _ex1, _ex2, _ex3 = st.columns(3)
 
         with _ex1:
-            try:
-                from utils.gisaid_parser import convert_df_to_fasta
-                _fasta_out = convert_df_to_fasta(_r)
-            except Exception:
-                _flines = []
-                for _, _fr in _r.iterrows():
-                    _fhdr = _fr.get("isolate", _fr.get("sequence_hash", "seq"))
-                    _flines.append(f">{_fhdr}")
-                    _flines.append(_fr.get("sequence", ""))
-                _fasta_out = "\n".join(_flines).encode("utf-8")
+            _fasta_out = convert_df_to_fasta_bytes(_r)
             st.download_button(
                 label=T("download_fasta_label", count=len(_r)),
                 data=_fasta_out,
@@ -1498,17 +1489,8 @@ with st.expander(f"🔬 {T('timeline_preview_header')}", expanded=True):
                                 _pf_stem = _pl_ex.Path(_pf_name).stem
                                 _pf_df   = _r[_r["_source_file"] == _pf_name].copy()
                                 # FASTA
-                                try:
-                                    from utils.gisaid_parser import convert_df_to_fasta
-                                    _pf_fasta_bytes = convert_df_to_fasta(_pf_df)
-                                except Exception:
-                                    _pf_lines = []
-                                    for _, _pfr in _pf_df.iterrows():
-                                        _pf_lines.append(f">{_pfr.get('isolate', _pfr.get('sequence_hash', 'seq'))}")
-                                        _pf_lines.append(_pfr.get("sequence", ""))
-                                    _pf_fasta_bytes = "\n".join(_pf_lines).encode("utf-8")
                                 _zf.writestr(f"{_pf_stem}_timeline.fasta",
-                                             _pf_fasta_bytes if isinstance(_pf_fasta_bytes, (bytes, bytearray)) else _pf_fasta_bytes)
+                                             convert_df_to_fasta_bytes(_pf_df))
                                 # Metadata CSV (no sequence col, no _source_file col)
                                 _pf_meta_cols = [c for c in _pf_df.columns
                                                  if c not in ("sequence", "_source_file")]
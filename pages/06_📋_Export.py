@@ -15,11 +15,56 @@ import re
 import zipfile
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import streamlit as st
 
-from utils.gisaid_parser import convert_df_to_fasta
+from utils.gisaid_parser import convert_df_to_fasta_bytes
 from utils.minimal_i18n import T
 
+try:
+    import orjson
+    _ORJSON = True
+except ImportError:
+    _ORJSON = False
+
+# File-name sanitisers, built once per process:
+#   _SAFE_TRANS      — split-group keys: path/shell metacharacters → "_"
+#   _UNSAFE_NAME_RE  — prefixes and source names: anything outside [\w-] → "_"
+_SAFE_TRANS     = str.maketrans(dict.fromkeys('/\\|: *?"<>', "_"))
+_UNSAFE_NAME_RE = re.compile(r"[^\w\-]")
+
+# Candidate split columns as (label, column); labels in _SPLIT_LABEL_KEYS
+# are translation keys, the rest are shown verbatim.
+_SPLIT_FIELDS = (
+    ("obs_col_subtype",  "subtype_clean"),
+    ("obs_col_host",     "host"),
+    ("obs_col_segment",  "segment"),
+    ("obs_col_location", "location"),
+    ("obs_col_clade",    "clade"),
+    ("Year",             "_year"),
+    ("Month",            "_month"),
+)
+_SPLIT_LABEL_KEYS = frozenset(k for k, _ in _SPLIT_FIELDS if k.startswith("obs_col_"))
+
+# Action-log column -> translation key for the Section 4 display table
+_LOG_COL_KEYS = (
+    ("action",    "log_col_action"),
+    ("file",      "log_col_file"),
+    ("sequences", "log_col_sequences"),
+    ("time_s",    "log_col_time_s"),
+    ("timestamp", "log_col_timestamp"),
+    ("files",     "log_col_files"),
+)
+
+
+def _json_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON — orjson when installed, stdlib json otherwise."""
+    if _ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
 st.title(f"\U0001f4cb {T('export_header')}")
 
 _active_df:   pd.DataFrame = st.session_state.get("active_df",   pd.DataFrame())
@@ -51,10 +96,26 @@ with _pfx_col:
         help=T("sidebar_export_prefix_help"),
         placeholder="virsift",
     )
-_pfx = re.sub(r"[^\w\-]", "_", (_pfx_input or "virsift").strip())[:40] or "virsift"
+_pfx = _UNSAFE_NAME_RE.sub("_", (_pfx_input or "virsift").strip())[:40] or "virsift"
 if _pfx != _pfx_default:
     st.session_state["export_prefix"] = _pfx
 
+
+def _export_payload(slot: str, build) -> bytes:
+    """Memoise build(_export_df) in session state for as long as the export
+    DataFrame object is unchanged.
+
+    Streamlit reruns this page on every widget interaction, but active_df /
+    filtered_df are replaced — never mutated — so identity is a safe key.
+    Holding the frame in the cache entry keeps its id from being recycled.
+    """
+    _hit = st.session_state.get(slot)
+    if _hit is None or _hit[0] is not _export_df:
+        _hit = (_export_df, build(_export_df))
+        st.session_state[slot] = _hit
+    return _hit[1]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # SECTION 1 — Quick Downloads
 # ─────────────────────────────────────────────────────────────────────────────
@@ -65,10 +126,10 @@ q1, q2, q3, q4 = st.columns(4)
 
 # — FASTA
 with q1:
-    fasta_str = convert_df_to_fasta(_export_df)
+    fasta_bytes = _export_payload("export_fasta_payload", convert_df_to_fasta_bytes)
     st.download_button(
         label=T("export_fasta_btn", n=f"{len(_export_df):,}"),
-        data=fasta_str.encode("utf-8"),
+        data=fasta_bytes,
         file_name=f"{_pfx}_sequences.fasta",
         mime="text/plain",
         type="primary",
@@ -78,10 +139,11 @@ with q1:
 
 # — CSV (metadata, no sequence)
 with q2:
-    csv_bytes = (
-        _export_df.drop(columns=["sequence"], errors="ignore")
-        .to_csv(index=False)
-        .encode("utf-8")
+    csv_bytes = _export_payload(
+        "export_csv_payload",
+        lambda df: df.drop(columns=["sequence"], errors="ignore")
+                     .to_csv(index=False)
+                     .encode("utf-8"),
     )
     st.download_button(
         label=T("export_csv_btn", n=f"{len(_export_df):,}"),
@@ -103,9 +165,11 @@ with q3:
         "operations": action_logs,
         "columns":    [c for c in _export_df.columns if c != "sequence"],
     }
+    # Serialised once — shared by this button and the ZIP bundle below
+    meta_json = _json_bytes(methodology)
     st.download_button(
         label=T("export_json_btn"),
-        data=json.dumps(methodology, indent=2, default=str).encode("utf-8"),
+        data=meta_json,
         file_name=f"{_pfx}_methodology.json",
         mime="application/json",
         use_container_width=True,
@@ -115,21 +179,17 @@ with q3:
 # — ZIP Bundle (FASTA + CSV + JSON)
 with q4:
     @st.cache_data(show_spinner=False)
-    def _make_bundle(fasta: str, csv: bytes, meta_json: str,
+    def _make_bundle(fasta: bytes, csv: bytes, meta_json: bytes,
                      pfx_key: str) -> bytes:
         buf = io.BytesIO()
         with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr(f"{pfx_key}_sequences.fasta",   fasta.encode("utf-8"))
+            zf.writestr(f"{pfx_key}_sequences.fasta",   fasta)
             zf.writestr(f"{pfx_key}_metadata.csv",      csv)
-            zf.writestr(f"{pfx_key}_methodology.json",  meta_json.encode("utf-8"))
+            zf.writestr(f"{pfx_key}_methodology.json",  meta_json)
         buf.seek(0)
         return buf.getvalue()
 
-    bundle = _make_bundle(
-        fasta_str, csv_bytes,
-        json.dumps(methodology, indent=2, default=str),
-        _pfx,
-    )
+    bundle = _make_bundle(fasta_bytes, csv_bytes, meta_json, _pfx)
     st.download_button(
         label=T("export_bundle_zip_btn"),
         data=bundle,
@@ -139,6 +199,47 @@ with q4:
         help=f"📄 {_pfx}_bundle.zip (FASTA + CSV + JSON) · rename prefix in sidebar",
     )
 
+# — Columnar metadata: Parquet + Arrow IPC (opt-in to keep the default row uncluttered)
+def _metadata_table(df: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(df.drop(columns=["sequence"], errors="ignore"),
+                                preserve_index=False)
+
+
+def _parquet_bytes(df: pd.DataFrame) -> bytes:
+    _buf = io.BytesIO()
+    pq.write_table(_metadata_table(df), _buf, compression="zstd", compression_level=3)
+    return _buf.getvalue()
+
+
+def _arrow_ipc_bytes(df: pd.DataFrame) -> bytes:
+    """Arrow IPC stream — lossless dtypes, no per-cell stringification."""
+    _table = _metadata_table(df)
+    _sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(_sink, _table.schema) as _writer:
+        _writer.write_table(_table)
+    return _sink.getvalue().to_pybytes()
+
+
+if st.toggle(T("export_parquet_toggle"), key="export_parquet_on",
+             help=T("export_parquet_toggle_help")):
+    _pq_col, _ipc_col, _ = st.columns([1, 1, 2])
+    _pq_col.download_button(
+        label=T("export_parquet_btn", n=f"{len(_export_df):,}"),
+        data=_export_payload("export_parquet_payload", _parquet_bytes),
+        file_name=f"{_pfx}_metadata.parquet",
+        mime="application/vnd.apache.parquet",
+        use_container_width=True,
+        help=f"📄 {_pfx}_metadata.parquet · rename prefix in sidebar",
+    )
+    _ipc_col.download_button(
+        label=T("export_arrow_btn", n=f"{len(_export_df):,}"),
+        data=_export_payload("export_arrow_payload", _arrow_ipc_bytes),
+        file_name=f"{_pfx}_metadata.arrows",
+        mime="application/vnd.apache.arrow.stream",
+        use_container_width=True,
+        help=f"📄 {_pfx}_metadata.arrows · rename prefix in sidebar",
+    )
+
 st.divider()
 
 
@@ -154,33 +255,89 @@ _last_act_ex  = next(
 _act_names_ex = _last_act_ex.get("files", []) if _last_act_ex else []
 _contrib_ex   = [rf for rf in _raw_files_ex if rf["name"] in _act_names_ex]
 
+# Per-file DataFrames survive reruns; entries for removed files are pruned.
+_pf_df_cache: dict = st.session_state.setdefault("pf_df_cache", {})
+for _stale in set(_pf_df_cache) - {rf["name"] for rf in _raw_files_ex}:
+    del _pf_df_cache[_stale]
+
+
+def _per_file_entry(rf: dict) -> dict:
+    """Cache entry for one raw_files entry: {'parsed', 'df', 'fasta'}.
+
+    The entry is tied to the identity of rf["parsed"], so a file that is
+    removed and re-uploaded under the same name is never served stale.
+    'fasta' is filled lazily by _per_file_fastas().
+    """
+    _hit = _pf_df_cache.get(rf["name"])
+    if _hit is None or _hit["parsed"] is not rf["parsed"]:
+        _hit = {"parsed": rf["parsed"], "df": pd.DataFrame(rf["parsed"]), "fasta": None}
+        _pf_df_cache[rf["name"]] = _hit
+    return _hit
+
+
+def _per_file_df(rf: dict) -> pd.DataFrame:
+    """DataFrame for one raw_files entry, rebuilt only when its records change."""
+    return _per_file_entry(rf)["df"]
+
+
+def _fallback_fasta(df: pd.DataFrame) -> str:
+    """Minimal '>id\nsequence' FASTA used when convert_df_to_fasta_bytes() fails.
+
+    Id is isolate, then sequence_hash, then the literal 'seq'.  Both columns
+    are resolved once into paired object arrays and joined in a single pass,
+    with no intermediate concatenated Series.
+    """
+    _ids = pd.Series("seq", index=df.index)
+    for _id_col in ("sequence_hash", "isolate"):
+        if _id_col in df.columns:
+            _ids = df[_id_col].fillna(_ids)
+    _id_arr = _ids.to_numpy(dtype=object)
+    _seq_arr = (
+        df["sequence"].fillna("").to_numpy(dtype=object) if "sequence" in df.columns
+        else [""] * len(df)
+    )
+    return "\n".join(f">{i}\n{s}" for i, s in zip(_id_arr, _seq_arr))
+
+
+def _encode_per_file(df: pd.DataFrame) -> bytes:
+    try:
+        return convert_df_to_fasta_bytes(df)
+    except Exception:
+        return _fallback_fasta(df).encode("utf-8")
+
+
+def _per_file_fastas(files: list) -> dict:
+    """{file name: FASTA bytes} for the contributing files.
+
+    Each file is encoded only when its cache entry has no encoding yet; the
+    result is stored on the entry and reused by the per-file ZIP.
+    """
+    _entries = {rf["name"]: _per_file_entry(rf) for rf in files}
+    for _e in _entries.values():
+        if _e["fasta"] is None:
+            _e["fasta"] = _encode_per_file(_e["df"])
+    return {name: e["fasta"] for name, e in _entries.items()}
+
+
 if len(_contrib_ex) > 1:
     st.subheader(f"📂 {T('export_per_file_header')}")
     st.caption(T("export_per_file_caption"))
 
-    import re as _re_ex
+    _pf_fastas = _per_file_fastas(_contrib_ex)
 
     for _pf_rf in _contrib_ex:
-        _pf_df    = pd.DataFrame(_pf_rf["parsed"])
+        _pf_df    = _per_file_df(_pf_rf)
         _pf_n     = _pf_rf["n_sequences"]
-        _pf_safe  = _re_ex.sub(r"[^\w\-]", "_", _pf_rf["name"])[:40]
+        _pf_safe  = _UNSAFE_NAME_RE.sub("_", _pf_rf["name"])[:40]
         _pf_label = _pf_rf["name"][:55] + ("…" if len(_pf_rf["name"]) > 55 else "")
 
         _pf_c0, _pf_c1, _pf_c2 = st.columns([3, 1, 1])
         _pf_c0.markdown(f"**{_pf_label}** — {_pf_n:,} seqs")
 
         with _pf_c1:
-            try:
-                _pf_fasta = convert_df_to_fasta(_pf_df)
-            except Exception:
-                _lines = []
-                for _, _r in _pf_df.iterrows():
-                    _lines.append(f">{_r.get('isolate', _r.get('sequence_hash', 'seq'))}")
-                    _lines.append(str(_r.get("sequence", "")))
-                _pf_fasta = "\n".join(_lines)
             st.download_button(
                 label=T("export_per_file_fasta"),
-                data=_pf_fasta.encode("utf-8") if isinstance(_pf_fasta, str) else _pf_fasta,
+                data=_pf_fastas[_pf_rf["name"]],
                 file_name=f"{_pfx}_{_pf_safe}.fasta",
                 mime="text/plain",
                 use_container_width=True,
@@ -216,20 +373,8 @@ if len(_contrib_ex) > 1:
                 _pf_zbuf = io.BytesIO()
                 with zipfile.ZipFile(_pf_zbuf, "w", zipfile.ZIP_DEFLATED) as _pf_zf:
                     for _zrf in _contrib_ex:
-                        _z_df   = pd.DataFrame(_zrf["parsed"])
-                        _z_safe = _re_ex.sub(r"[^\w\-]", "_", _zrf["name"])[:40]
-                        try:
-                            _z_fa = convert_df_to_fasta(_z_df)
-                        except Exception:
-                            _zl = []
-                            for _, _r in _z_df.iterrows():
-                                _zl.append(f">{_r.get('isolate', 'seq')}")
-                                _zl.append(str(_r.get("sequence", "")))
-                            _z_fa = "\n".join(_zl)
-                        _pf_zf.writestr(
-                            f"{_pfx}_{_z_safe}.fasta",
-                            _z_fa.encode("utf-8") if isinstance(_z_fa, str) else _z_fa,
-                        )
+                        _z_safe = _UNSAFE_NAME_RE.sub("_", _zrf["name"])[:40]
+                        _pf_zf.writestr(f"{_pfx}_{_z_safe}.fasta", _pf_fastas[_zrf["name"]])
                 _pf_zbuf.seek(0)
                 st.download_button(
                     label=f"⬇ {_pfx}_source_files.zip",
@@ -256,10 +401,9 @@ if _tl_result_df is not None and not _tl_result_df.empty:
     _tl_q1, _tl_q2, _tl_q3 = st.columns(3)
 
     with _tl_q1:
-        _tl_fasta_str = convert_df_to_fasta(_tl_result_df)
         st.download_button(
             label=T("export_timeline_fasta_btn", n=f"{len(_tl_result_df):,}"),
-            data=_tl_fasta_str.encode("utf-8"),
+            data=convert_df_to_fasta_bytes(_tl_result_df),
             file_name=f"{_pfx}_curated_timeline.fasta",
             mime="text/plain",
             type="primary",
@@ -305,20 +449,13 @@ if _tl_result_df is not None and not _tl_result_df.empty:
 st.subheader(f"🗂 {T('export_split_header')}")
 st.caption(T("export_split_caption"))
 
-# Candidate split columns
-_SPLIT_FIELDS = {
-    T("obs_col_subtype"):  "subtype_clean",
-    T("obs_col_host"):     "host",
-    T("obs_col_segment"):  "segment",
-    T("obs_col_location"): "location",
-    T("obs_col_clade"):    "clade",
-    "Year":                "_year",
-    "Month":               "_month",
-}
-# Keep only columns that actually exist
+# Keep only columns that actually exist; labels are translated per rerun so a
+# language switch is picked up immediately.
+_export_cols = set(_export_df.columns)
 _available_split = {
-    label: col for label, col in _SPLIT_FIELDS.items()
-    if col.startswith("_") or col in _export_df.columns
+    (T(label_key) if label_key in _SPLIT_LABEL_KEYS else label_key): col
+    for label_key, col in _SPLIT_FIELDS
+    if col.startswith("_") or col in _export_cols
 }
 
 sp1, sp2 = st.columns([2, 1])
@@ -352,6 +489,19 @@ def _get_split_series(df: pd.DataFrame, col: str) -> pd.Series:
     return df.get(col, pd.Series(["Unknown"] * len(df), index=df.index)).astype(str)
 
 
+def _split_group_fastas(groups: pd.DataFrame) -> dict:
+    """Encode every split group to FASTA bytes in a single groupby pass.
+
+    Called once per split preview; the result is kept in session state as
+    "split_group_fastas" and shared by the per-group download grid and the
+    ZIP builder, so reruns neither re-encode nor re-hash the groups.
+    """
+    return {
+        key: convert_df_to_fasta_bytes(grp.drop(columns=["_split_key"]))
+        for key, grp in groups.groupby("_split_key", sort=False)
+    }
+
+
 if st.button(T("export_split_preview_btn"), use_container_width=True):
     field_col = _available_split[split_label]
     series = _get_split_series(_split_df, field_col).replace("nan", pd.NA).dropna()
@@ -365,6 +515,7 @@ if st.button(T("export_split_preview_btn"), use_container_width=True):
         .rename(columns={"_split_key": split_label})
     )
     st.session_state["split_groups_df"] = groups
+    st.session_state["split_group_fastas"] = _split_group_fastas(groups)
     st.session_state["split_field_col"]  = field_col
     st.session_state["split_label"]      = split_label
     st.session_state["split_summary"]    = group_summary
@@ -374,6 +525,10 @@ if "split_summary" in st.session_state:
     groups_df  = st.session_state["split_groups_df"]
     n_groups   = len(summary_df)
     n_seqs     = int(summary_df["Sequences"].sum())
+    _grp_fastas = st.session_state.get("split_group_fastas")
+    if _grp_fastas is None:
+        _grp_fastas = _split_group_fastas(groups_df)
+        st.session_state["split_group_fastas"] = _grp_fastas
 
     st.markdown(
         f"**{n_groups} groups** — {n_seqs:,} sequences total "
@@ -393,18 +548,11 @@ if "split_summary" in st.session_state:
         with st.spinner(T("export_split_generating", n=n_groups)):
             zip_buf = io.BytesIO()
             with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-                for key, grp in groups_df.groupby("_split_key"):
-                    safe = (str(key)
-                            .replace("/","_").replace("\\","_")
-                            .replace("|","_").replace(" ","_")
-                            .replace(":","_").replace("*","_")
-                            .replace("?","_").replace('"','_')
-                            .replace("<","_").replace(">","_"))
-                    grp_clean = grp.drop(columns=["_split_key"])
-                    content   = convert_df_to_fasta(grp_clean)
+                for key, content in _grp_fastas.items():
+                    safe = str(key).translate(_SAFE_TRANS)
                     zf.writestr(
                         f"{st.session_state['split_label']}_{safe}.fasta",
-                        content.encode("utf-8"),
+                        content,
                     )
             zip_buf.seek(0)
             _split_zip_name = f"{_pfx}_split_by_{st.session_state['split_label']}.zip"
@@ -422,22 +570,16 @@ if "split_summary" in st.session_state:
     # — Individual downloads — ALL groups in a horizontal 4-per-row grid
     st.caption(T("export_split_individual_caption"))
     _all_keys = summary_df[st.session_state["split_label"]].tolist()
+    _grp_counts = dict(zip(_all_keys, summary_df["Sequences"].tolist()))
     _ind_cols = st.columns(4)
     for _ki, _ikey in enumerate(_all_keys):
-        _isafe = (str(_ikey)
-                  .replace("/","_").replace("\\","_")
-                  .replace("|","_").replace(" ","_")
-                  .replace(":","_").replace("*","_")
-                  .replace("?","_").replace('"','_')
-                  .replace("<","_").replace(">","_"))
-        _igrp    = groups_df[groups_df["_split_key"] == _ikey].drop(columns=["_split_key"])
-        _in_g    = len(_igrp)
+        _isafe = str(_ikey).translate(_SAFE_TRANS)
+        _in_g    = _grp_counts.get(_ikey, 0)
         _idisp   = str(_ikey)[:20] + "…" if len(str(_ikey)) > 20 else str(_ikey)
-        _ifasta  = convert_df_to_fasta(_igrp)
         _igrp_fn = f"{_pfx}_{st.session_state['split_label']}_{_isafe}.fasta"
         _ind_cols[_ki % 4].download_button(
             label=f"📄 {_idisp}  ({_in_g})",
-            data=_ifasta.encode("utf-8"),
+            data=_grp_fastas.get(_ikey, b""),
             file_name=_igrp_fn,
             mime="text/plain",
             use_container_width=True,
@@ -446,7 +588,7 @@ if "split_summary" in st.session_state:
         )
 
     if st.button(T("export_split_clear"), use_container_width=True):
-        for k in ("split_groups_df","split_field_col","split_label","split_summary"):
+        for k in ("split_groups_df","split_group_fastas","split_field_col","split_label","split_summary"):
             st.session_state.pop(k, None)
         st.rerun()
 
@@ -481,7 +623,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
             help=T("export_seg_file_prefix_help"),
         )
     # Sanitise — same rules as the global prefix
-    _seg_file_pfx = re.sub(r"[^\w\-]", "_", (_seg_pfx_input or _pfx).strip())[:40] or _pfx
+    _seg_file_pfx = _UNSAFE_NAME_RE.sub("_", (_seg_pfx_input or _pfx).strip())[:40] or _pfx
 
     # ── Preset quick-selectors ────────────────────────────────────────────────
     st.caption(T("export_seg_presets_label"))
@@ -623,7 +765,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
             if _is_nested_mode and _nested_split_keys:
                 # Nested: show sub-folder per split key
                 for _ni, _nk in enumerate(_nested_split_keys):
-                    _nk_safe = re.sub(r"[^\w\-]", "_", str(_nk))
+                    _nk_safe = _UNSAFE_NAME_RE.sub("_", str(_nk))
                     _is_last_nk = (_ni == len(_nested_split_keys) - 1) and not _include_readme
                     _nk_conn = "└" if _is_last_nk else "├"
                     _preview_lines.append(f"{_indent}{_nk_conn}── 📁 {_nk_safe}/")
@@ -689,7 +831,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
                         _ns_src = st.session_state["split_groups_df"]
                         _seg_col = "segment"
                         for _nk in _nested_split_keys:
-                            _nk_safe = re.sub(r"[^\w\-]", "_", str(_nk))
+                            _nk_safe = _UNSAFE_NAME_RE.sub("_", str(_nk))
                             # Filter: rows where segment matches AND split key matches
                             _nk_mask = _ns_src["_split_key"] == _nk
                             if _seg_col in _ns_src.columns:
@@ -700,7 +842,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
                                 _seg_zf.writestr(f"{_seg}/{_nk_safe}/.gitkeep", "")
                                 continue
                             try:
-                                _nk_fasta = convert_df_to_fasta(_nk_rows)
+                                _nk_fasta = convert_df_to_fasta_bytes(_nk_rows)
                                 _seg_zf.writestr(
                                     f"{_seg}/{_nk_safe}/{_seg_file_pfx}_{_seg}_{_nk_safe}.fasta",
                                     _nk_fasta if isinstance(_nk_fasta, bytes)
@@ -722,7 +864,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
                         _seg_subset = _get_seg_subset(_seg)
                         if not _seg_subset.empty:
                             try:
-                                _seg_fasta = convert_df_to_fasta(_seg_subset)
+                                _seg_fasta = convert_df_to_fasta_bytes(_seg_subset)
                                 _seg_zf.writestr(
                                     f"{_seg}/{_seg_file_pfx}_{_seg}.fasta",
                                     _seg_fasta if isinstance(_seg_fasta, bytes)
@@ -755,7 +897,7 @@ with st.expander(f"📁 {T('export_seg_folder_header')}", expanded=False):
 
             _seg_zbuf.seek(0)
             _seg_fname = (
-                re.sub(r"[^\w\-]", "_", (_seg_zip_name or "segment_folders").strip())[:60]
+                _UNSAFE_NAME_RE.sub("_", (_seg_zip_name or "segment_folders").strip())[:60]
                 or "segment_folders"
             ) + ".zip"
             st.download_button(
@@ -777,15 +919,16 @@ with st.expander(f"🔑 {T('export_accession_header')}"):
     st.caption(T("export_accession_caption"))
 
     if "accession" in _export_df.columns:
+        # Trim → prefix filter → unique → sort, all in Arrow compute kernels
+        _acc_arr = pc.utf8_trim_whitespace(
+            pa.array(_export_df["accession"].astype("string"), type=pa.string())
+        )
         acc_series = (
-            _export_df["accession"]
-            .dropna()
-            .astype(str)
-            .str.strip()
-            .pipe(lambda s: s[s.str.startswith("EPI_ISL")])
-            .unique()
+            pc.unique(_acc_arr.filter(pc.starts_with(_acc_arr, pattern="EPI_ISL")))
+            .sort()
+            .to_pylist()
         )
-        acc_text = "\n".join(sorted(acc_series))
+        acc_text = "\n".join(acc_series)
         st.code(
             acc_text[:800] + (T("export_more_items", n=len(acc_series) - 20) if len(acc_series) > 20 else ""),
             language=None,
@@ -813,15 +956,23 @@ with st.expander(f"📋 {T('export_log_header')}"):
 
     logs = st.session_state.get("action_logs", [])
     if logs:
-        _col_rename = {
-            "action":    T("log_col_action"),
-            "file":      T("log_col_file"),
-            "sequences": T("log_col_sequences"),
-            "time_s":    T("log_col_time_s"),
-            "timestamp": T("log_col_timestamp"),
-            "files":     T("log_col_files"),
-        }
-        log_df = pd.DataFrame(logs).rename(columns=_col_rename)
+        _col_rename = {col: T(key) for col, key in _LOG_COL_KEYS}
+        # action_logs is append-only, so the raw frame and its encoded
+        # payloads are reused until its length changes; the display copy is
+        # derived from the same frame instead of a second DataFrame build.
+        _log_payloads = st.session_state.get("export_log_payloads")
+        if _log_payloads is None or _log_payloads[0] != len(logs):
+            _raw_log_df = pd.DataFrame(logs)
+            _log_payloads = (
+                len(logs),
+                _raw_log_df,
+                _raw_log_df.to_csv(index=False).encode("utf-8"),
+                _json_bytes(logs),
+            )
+            st.session_state["export_log_payloads"] = _log_payloads
+        _, _raw_log_df, _log_csv_bytes, _log_json_bytes = _log_payloads
+
+        log_df = _raw_log_df.rename(columns=_col_rename)
         _act_col = T("log_col_action")
         if _act_col in log_df.columns:
             log_df[_act_col] = log_df[_act_col].replace({
@@ -831,13 +982,12 @@ with st.expander(f"📋 {T('export_log_header')}"):
         log_df = log_df.fillna("-")
         st.dataframe(log_df, use_container_width=True, hide_index=True)
 
-        # Download uses original log (raw dict keys preserved for machine-readability)
-        _raw_log_df = pd.DataFrame(logs)
+        # Download uses original log (raw dict keys preserved for machine-readability).
         dl1, dl2 = st.columns(2)
         with dl1:
             st.download_button(
                 label=T("export_log_csv_btn"),
-                data=_raw_log_df.to_csv(index=False).encode("utf-8"),
+                data=_log_csv_bytes,
                 file_name=f"{_pfx}_log.csv",
                 mime="text/csv",
                 use_container_width=True,
@@ -846,7 +996,7 @@ with st.expander(f"📋 {T('export_log_header')}"):
         with dl2:
             st.download_button(
                 label=T("export_log_json_btn"),
-                data=json.dumps(logs, indent=2, default=str).encode("utf-8"),
+                data=_log_json_bytes,
                 file_name=f"{_pfx}_log.json",
                 mime="application/json",
                 use_container_width=True,
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tie ordering in AdaptiveBiologicalSampler's Endemic sampling."""
+
+import numpy as np
+import pandas as pd
+
+from utils.adaptive_sampler import AdaptiveBiologicalSampler
+from utils.peak_detector import EpiWaveDetector
+
+
+def _endemic_frame(wave_sizes):
+    """Upload-ordered frame over ~14 months where every week's rows share
+    one date; wave_sizes maps week number → row count (default 1).  Rows
+    are shuffled so the sampler has to sort, and sequence_hash is unique so
+    deduplication never hides which tied row was picked.
+    """
+    start = pd.Timestamp("2023-01-02")
+    dates = []
+    for week in range(60):
+        dates += [start + pd.Timedelta(weeks=week)] * wave_sizes.get(week, 1)
+    order = np.random.default_rng(0).permutation(len(dates))
+    n = len(dates)
+    return pd.DataFrame({
+        "accession_id":    [f"EPI_{i}" for i in range(n)],
+        "collection_date": np.array(dates, dtype="datetime64[ns]")[order],
+        "sequence_hash":   [f"h{i}" for i in range(n)],
+    })
+
+
+def _first_uploaded(df, date):
+    return df.loc[df["collection_date"] == date, "accession_id"].iloc[0]
+
+
+def test_wave_representatives_keep_upload_order_on_ties():
+    df = _endemic_frame({10: 40, 11: 60, 12: 40, 35: 40, 36: 60, 37: 40})
+    sampler = AdaptiveBiologicalSampler()
+    assert sampler.calculate_lifespan_category(df) == "Endemic"
+    assert EpiWaveDetector().detect_epi_waves(df)["wave_count"] >= 2
+
+    out = sampler.apply_proportionality_rule(df)
+
+    last = df["collection_date"].max()
+    assert len(out) > 2
+    for date, acc in zip(out["collection_date"], out["accession_id"]):
+        if date == last:  # closing bookend: last upload on the last date
+            ties = df.loc[df["collection_date"] == date, "accession_id"]
+            assert acc == ties.iloc[-1]
+        else:
+            assert acc == _first_uploaded(df, date)
+
+
+def test_quarterly_fallback_keeps_upload_order_on_ties():
+    # A flat weekly signal has no waves, so Endemic falls back to one row
+    # per quarter; without sequence_hash that is the first row per quarter.
+    df = _endemic_frame({week: 5 for week in range(60)})
+    df = df.drop(columns="sequence_hash")
+
+    out = AdaptiveBiologicalSampler().apply_proportionality_rule(df, "Endemic")
+
+    assert len(out) == 5
+    for date, acc in zip(out["collection_date"], out["accession_id"]):
+        assert acc == _first_uploaded(df, date)
@@ -20,6 +20,31 @@ import time
 import numpy as np
 import pandas as pd
 
+from utils.peak_detector import _as_datetime, _week_ordinals
+
+
+def _period_key(dates: pd.Series, freq: str) -> np.ndarray:
+    """Integer bucket per date for freq 'W' (Monday-start weeks), 'M' or 'Q'.
+
+    Same grouping as .dt.to_period(freq) but straight from the datetime64
+    values, without building a PeriodArray.  *dates* must be NaT-free.
+    """
+    if freq == "W":
+        return _week_ordinals(dates)
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    months = values.astype("datetime64[M]").astype(np.int64)
+    return months // 3 if freq == "Q" else months
+
+
+def _in_date_order(dates: pd.Series) -> bool:
+    """True when *dates* already has the order a stable sort_values() would
+    give it: non-null dates ascending with every NaT at the end.
+    """
+    return (
+        dates.notna().is_monotonic_decreasing
+        and dates.dropna().is_monotonic_increasing
+    )
+
 
 class AdaptiveBiologicalSampler:
     """Proportional sampling engine for epidemiological sequence datasets."""
@@ -38,7 +63,7 @@ class AdaptiveBiologicalSampler:
         if df.empty or "collection_date" not in df.columns:
             return "Seasonal"
 
-        dates = pd.to_datetime(df["collection_date"], errors="coerce").dropna()
+        dates = _as_datetime(df["collection_date"]).dropna()
         if dates.empty:
             return "Seasonal"
 
@@ -56,10 +81,22 @@ class AdaptiveBiologicalSampler:
         """Dispatch to the correct sampling resolution for the given category.
 
         If category is None, auto-detects via calculate_lifespan_category().
+        collection_date is parsed and the frame sorted by it once here; the
+        samplers below expect datetime64 dates in ascending order.  The sort
+        is stable, so rows sharing a date stay in upload order.  Input that
+        is already in date order (e.g. a previous sample) skips the sort.
         """
         if df.empty:
             return df
 
+        if "collection_date" in df.columns:
+            dates = _as_datetime(df["collection_date"])
+            df = df.assign(collection_date=dates)
+            if not _in_date_order(dates):
+                df = df.sort_values(
+                    "collection_date", kind="stable", ignore_index=True
+                )
+
         if category is None:
             category = self.calculate_lifespan_category(df)
 
@@ -79,27 +116,7 @@ class AdaptiveBiologicalSampler:
         if df.empty or "collection_date" not in df.columns:
             return df
 
-        df = df.copy()
-        df["_week"] = (
-            pd.to_datetime(df["collection_date"], errors="coerce")
-            .dt.to_period("W")
-        )
-
-        group_cols = (
-            ["sequence_hash", "_week"]
-            if "sequence_hash" in df.columns
-            else ["_week"]
-        )
-
-        result = (
-            df.dropna(subset=["_week"])
-              .sort_values("collection_date")
-              .groupby(group_cols, sort=False, observed=True)
-              .first()
-              .reset_index()
-              .drop(columns=["_week"])
-        )
-        return result
+        return self._first_per_period(df, "W")
 
     def _monthly_sentinel_sampling(self, df: pd.DataFrame) -> pd.DataFrame:
         """Monthly first-of-period sampling for seasonal datasets (90-270 days).
@@ -109,27 +126,7 @@ class AdaptiveBiologicalSampler:
         if df.empty or "collection_date" not in df.columns:
             return df
 
-        df = df.copy()
-        df["_month"] = (
-            pd.to_datetime(df["collection_date"], errors="coerce")
-            .dt.to_period("M")
-        )
-
-        group_cols = (
-            ["sequence_hash", "_month"]
-            if "sequence_hash" in df.columns
-            else ["_month"]
-        )
-
-        result = (
-            df.dropna(subset=["_month"])
-              .sort_values("collection_date")
-              .groupby(group_cols, sort=False, observed=True)
-              .first()
-              .reset_index()
-              .drop(columns=["_month"])
-        )
-        return result
+        return self._first_per_period(df, "M")
 
     def _quarterly_or_wave_sampling(self, df: pd.DataFrame) -> pd.DataFrame:
         """Quarterly or wave-crest sampling for endemic datasets (>270 days).
@@ -154,27 +151,33 @@ class AdaptiveBiologicalSampler:
         if "collection_date" not in df.columns:
             return df
 
-        df = df.copy()
-        df["_quarter"] = (
-            pd.to_datetime(df["collection_date"], errors="coerce")
-            .dt.to_period("Q")
-        )
-
-        group_cols = (
-            ["sequence_hash", "_quarter"]
-            if "sequence_hash" in df.columns
-            else ["_quarter"]
-        )
-
-        result = (
-            df.dropna(subset=["_quarter"])
-              .sort_values("collection_date")
-              .groupby(group_cols, sort=False, observed=True)
-              .first()
-              .reset_index()
-              .drop(columns=["_quarter"])
-        )
-        return result
+        return self._first_per_period(df, "Q")
+
+    def _first_per_period(self, df: pd.DataFrame, freq: str) -> pd.DataFrame:
+        """Earliest row per (sequence_hash, period) — or per period alone when
+        sequence_hash is absent.  Rows with no parseable date are dropped.
+
+        Computes a keep-mask from the key columns alone and takes the kept
+        rows in one slice; df itself is never widened with a period column.
+        Avoids groupby().first(), which builds a hash table, reassembles the
+        index and (because first() skips nulls column by column) could
+        stitch one output row together from several input rows.  The period
+        is an integer key from _period_key() — duplicate detection on
+        Period objects falls back to a slow object path.  Input must be
+        pre-sorted by datetime64 collection_date ascending with a stable
+        sort (see apply_proportionality_rule()), so among rows sharing a
+        date the one kept is the earliest in upload order.
+        """
+        dates = df["collection_date"]
+        valid = dates.notna().to_numpy()
+        rows = np.flatnonzero(valid)
+        keys = {"_period": _period_key(dates[valid], freq)}
+        if "sequence_hash" in df.columns:
+            keys["sequence_hash"] = df["sequence_hash"].to_numpy()[rows]
+        first = ~pd.DataFrame(keys).duplicated(keep="first").to_numpy()
+        out = df.take(rows[first])
+        out.index = pd.RangeIndex(len(out))
+        return out
 
     def _fallback_chronological_sampling(
         self, df: pd.DataFrame, target_n: int = 500
@@ -186,9 +189,14 @@ class AdaptiveBiologicalSampler:
         if df.empty or len(df) <= target_n:
             return df
 
-        df_sorted = df.sort_values("collection_date").reset_index(drop=True)
+        if _in_date_order(df["collection_date"]):
+            df_sorted = df.reset_index(drop=True)
+        else:
+            df_sorted = df.sort_values(
+                "collection_date", kind="stable", ignore_index=True
+            )
         step = len(df_sorted) / target_n
-        indices = [int(i * step) for i in range(target_n)]
+        indices = (np.arange(target_n) * step).astype(np.int64)
         return df_sorted.iloc[indices].copy()
 
     def _pre_cluster_sequences(
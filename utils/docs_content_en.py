@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+utils/docs_content_en.py — English long-form blocks for the Documentation page.
+
+Imported lazily by pages/07_📚_Documentation.py for the active language only.
+Plain Markdown strings; keep the four names in step with docs_content_ru.py.
+"""
+
+__all__ = ["QUICKSTART", "FEATURE_TABLE", "TIPS_FAQ", "HEADER_FORMAT"]
+
+QUICKSTART = """\
+### Step 1 — 📁 Upload Your Data
+Navigate to **Workspace** in the sidebar. Click *File Upload*, drag-and-drop
+your `.fasta`, `.fa`, `.fas`, `.fna`, `.txt`, `.gz`, or `.aln-fasta` file,
+then wait for the success banner. Your file is now in the session.
+
+> **Alignment files (`.aln-fasta` / `.aln`):** Clustal Omega MSA output is
+> fully supported. Gap characters (`-`) are stripped automatically before
+> length and hash computation, so all downstream analytics are unaffected.
+
+### Step 2 — ✅ Activate the Dataset
+Scroll down to **Loaded Datasets**. A stats table shows each file's sequence
+count, subtypes, segments and date span. Click **⚡ Activate All** to merge
+all files at once, or select specific files and click **Activate Selected**.
+> **Nothing works until you activate.**
+> **Multiple files merged?** Sequence Refinery, Analytics and Molecular
+> Timeline each show a **📁 File Scope** selector — switch to any single
+> source file for focused per-file analysis without re-uploading.
+
+### Step 3 — 🔬 Filter & Refine
+Go to **Sequence Refinery**. Use the quality sliders (min/max length, N-run),
+header-component filters (subtype, clade, date, host), and the HITL Smart
+Sampler to get a representative phylogenetic subset.
+
+### Step 4 — 📊 Explore & Visualize
+Open **Analytics** for 10+ chart types (distribution, temporal, stacked,
+epidemic curve, sunburst, treemap, violin, bubble, parallel, Gantt). Use the
+**Palette Studio** to customise colours. Visit **Molecular Timeline** for
+clone-persistence and overwintering analysis. All three analysis pages show
+a **📁 File Scope** selector when multiple source files are active — pick
+any file to narrow every chart and filter to that file only.
+
+The **Observatory** (this page, when data is active) offers a live KPI
+dashboard plus three advanced visualizations accessible via the sidebar
+checkbox: **Sankey flow** (Host → Subtype → Clade), **Icicle hierarchy**
+(Segment → Subtype → Clade), and a **3D Scatter** (Year × Length × Segment).
+
+### Step 5 — 📋 Export
+Go to **Export** to download the final FASTA, a CSV of metadata, a
+methodology JSON, or a ZIP bundle of all three. Use *Split & Export* to
+create one FASTA file per subtype / clade / host automatically.
+
+> **Segment Folder Structure:** The Export page includes a dedicated section
+> to generate a ZIP archive with segment folders (HA, NA, PB2, PB1, PA, NP,
+> MP, NS, HE, P3). Choose from three content modes: *Empty folders (scaffold
+> only)*, *Populate from active/filtered dataset*, or *Populate from Split &
+> Export above* — the third option appears automatically when you have
+> previewed a segment-level split in the Split & Export section above it,
+> routing that exact data directly into the folder ZIP.
+"""
+
+FEATURE_TABLE = """\
+| Page | Key Actions | Notes |
+|------|-------------|-------|
+| **🌍 Observatory** | Live KPI dashboard (sequence count, avg length, subtypes, date span); epidemic curve; top subtypes/hosts/segments/locations/clades; Sankey flow, Icicle hierarchy, 3D Scatter (via sidebar checkbox) | Landing page when no data loaded; auto-switches to dashboard when dataset is active |
+| **📁 Workspace** | File upload (`.fasta` `.fa` `.gz` `.zip` `.aln-fasta`); per-file stats table (subtypes, segments, date span); Select All / ⚡ Activate All; merge; **2×2 Top Metrics grid** (subtypes, segments, locations, host species) after activation | Activate before any other step; multiple files merged at once |
+| **🔬 Sequence Refinery** | Min/max length, N-run filter, dedup, subtype/clade/date/host/location filters, HITL Smart Sampler; **📁 per-file scope**; dataset-aware strategy recommendation box; per-strategy sensitivity guide | Scope selector focuses all filters on one source file |
+| **🧬 Molecular Timeline** | Clone persistence matrix, per-month representative selection, diagnostics, methodology snapshot; **📁 per-file scope**; **🔍 6-dimensional scope filter** (segment, subtype, host, host species, location, clade) | Needs `sequence_hash`; scope analyses each file's clusters independently |
+| **📊 Analytics** | 10+ chart types, custom palettes, dataset-overview gauges (count, avg length, completeness); **📁 per-file scope**; **🔍 6-dimensional scope filter** (segment, subtype, host, host species, location, clade) | Scope filters AND-combined; only non-trivial dimensions shown |
+| **📋 Export** | FASTA, CSV, JSON, ZIP bundle, accession list (.txt), session log, split-by-group export; Segment Folder Structure ZIP with **preset buttons** (Surface, Polymerase, Internal), sequence counts on labels, optional README per folder, optional summary CSV, live folder-structure preview, **3-mode data source** (empty / from dataset / from Split & Export); per-source-file downloads | Always export before closing the browser |
+"""
+
+TIPS_FAQ = """\
+### 💡 Tips
+
+| Tip | Detail |
+|-----|--------|
+| **Activation is Key** | Only sequences from *activated* datasets are used for analysis. Think of it as "loading the experiment." |
+| **Large Files** | Processing large files can take time. Watch the progress bar spinners as indicators. The default row limit is 5,000 for some charts — increase via the slider. |
+| **Caching** | Parsing is cached per file content hash. Re-uploading the same file is faster on re-run. Clear the cache by resetting the session. |
+| **Session Data** | All work lives in your browser session and is lost on tab close or refresh. Use the Export page to save your results *before* closing. |
+| **Filtered vs Active** | Most pages prefer the *filtered* dataset if one exists, falling back to the full *active* dataset. The source label shows which is in use. |
+| **Language Toggle** | Switch between English and Russian at any time from the sidebar — all labels, buttons, and charts update immediately. |
+| **Batch Multi-File** | Upload several FASTA files and click **⚡ Activate All** to merge them instantly. Once merged, Sequence Refinery, Analytics and Molecular Timeline all display a **📁 File Scope** radio at the top — switch to any source file to analyse it independently, then back to *All files (merged)* for the full view. |
+| **Multi-Dimensional Scope** | After selecting a source file, open the **🔍 Scope Filters** expander in Analytics or Timeline to add up to 6 independent dimension filters (segment, subtype, host, **host species**, location, clade). Use *Host* to filter broadly (Avian / Human) and *Host Species* to zoom into specific birds (common_teal, Anas_platyrhynchos, duck, etc.). |
+| **Host Inference** | Host class is inferred from the isolate name using the **GISAID structural rule**: avian/animal isolates always have 5 slash-parts (`A/HOST/Location/ID/Year`); human isolates always have 4 (`A/Location/ID/Year`). The parser therefore never confuses `A/common_teal/Chany/892/2018` (avian H3N6) with `A/Novosibirsk/RII-7.414/2024` (human H3N2) even though both are H3Nx. For the specific host class (Avian vs Mammalian), keyword lookup covers Latin genera (`Anas_platyrhynchos` → Avian) and compound names (`common_teal` → Avian). Any 5-part A/B isolate with an **unrecognised** host token still defaults to Avian — not Human — because the structural guarantee is authoritative. A `host_species` column stores the exact species token from slot 1. |
+
+---
+
+### ❓ Frequently Asked Questions
+
+**Q: My sequences show "Unknown" subtype after upload. Why?**
+> The header parser expects pipe-delimited fields matching GISAID's export format. If your headers use a different separator or order, use the *Header Converter* in Sequence Refinery to normalise them first.
+
+**Q: Why is the Molecular Timeline matrix empty?**
+> The timeline requires a `sequence_hash` column (added during deduplication in Sequence Refinery) and at least one sequence present in two or more months. Run *Deduplicate* first.
+
+**Q: Analytics charts show "No data." after filtering.**
+> The filter may have reduced the dataset to zero sequences. Check the sidebar *Active Sequences* count. Reset filters in Sequence Refinery if needed.
+
+**Q: I uploaded the same file twice — why does it still show two entries?**
+> Vir-Seq-Sift detects duplicate filenames and skips re-parsing, but the entry persists in the loaded files list until you remove it. Click *Remove* next to the duplicate in Workspace.
+
+**Q: How do I export per-subtype FASTA files?**
+> In the Export page, open *Split & Export*, select **Subtype** as the split field, click *Preview Groups*, then download the ZIP of all sub-FASTAs.
+
+**Q: I merged 3 files but want to see each file's clusters / charts separately.**
+> In **Molecular Timeline**, **Analytics**, or **Sequence Refinery**, look for the
+> **📁 File Scope** radio selector near the top of the page (only shown when
+> multiple source files are active). Select any source file to narrow all charts,
+> filters, and matrices to that file's sequences. Choose *All files (merged)* to
+> restore the combined dataset view.
+
+**Q: Can I use VirSift offline?**
+> Yes — run `streamlit run app.py` locally after installing requirements. All processing is local; no sequences are ever uploaded to external servers.
+
+**Q: My avian FASTA shows segments in the Subtype column and subtypes in the Segment column — why?**
+> GISAID avian batch downloads use **segment-first** field order: `Isolate|SEGMENT|SUBTYPE|Date|Accession|Clade`. Human/B downloads use **subtype-first** order. VirSift auto-detects the order by checking whether field 2 matches a known segment name (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3). If you see swapped columns, it may indicate a non-standard export — try normalising with the Header Converter.
+
+**Q: Why is `Anas_platyrhynchos` (or another Latin species name) showing as "Unknown" host?**
+> The parser's host classifier recognises Latin binomials by genus name. Ensure your headers use the standard GISAID format with underscores (`Anas_platyrhynchos`, not `Anas platyrhynchos`). Common genera like Anas, Gallus, Anser, Cygnus, Sus, Bos, Equus are all covered. If a genus is missing, open an issue so it can be added to `_AVIAN_GENERA` or `_MAMMAL_GENERA` in `utils/gisaid_parser.py`.
+
+**Q: The 🔍 Scope Filters expander doesn't appear in Analytics — why?**
+> The expander is only shown when the active dataset contains **at least one column** with 2 or more unique, non-"Unknown" values. A single-segment, single-host file with no meaningful diversity in any dimension will not show the expander — filter the full dataset in Sequence Refinery first.
+"""
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Header format — three-virus reference (hRSV | Avian Flu | Human Flu)
+# ─────────────────────────────────────────────────────────────────────────────
+HEADER_FORMAT = """\
+Vir-Seq-Sift supports **GISAID pipe-delimited** headers for three virus groups.
+Each group uses a different field count and ordering — choose the one that matches
+your GISAID download.
+
+---
+
+## 🫁 Human Respiratory Syncytial Virus (hRSV)
+
+**Header structure:**
+```
+>Isolate_Name|GISAID_Accession|Collection_Date
+```
+
+| # | Field | Example | Format |
+|---|-------|---------|--------|
+| 1 | **Isolate Name** | `hRSV/B/Argentina/BA-HNRG-206/2016` | hRSV/Subtype/Location/ID/Year |
+| 2 | **Accession** | `EPI_ISL_1074181` | EPI_ISL_XXXXXXX |
+| 3 | **Collection Date** | `2016-04-18` | YYYY-MM-DD, YYYY-MM, YYYY, or `unknown` |
+
+**Valid hRSV examples:**
+```fasta
+>hRSV/B/South_Korea/YSU-96B19/un|EPI_ISL_19159645|unknown
+>hRSV/A/Argentina/BA-HNRG-206/2016|EPI_ISL_1074181|2016-04-18
+>RSV/Human/GBR/2023-001|RSV_A|G|2023-11-04|EPI_ISL_17000001|ON1
+```
+
+**GISAID download settings for RSV:**
+- FASTA Header field: **Isolate name | Isolate ID | Collection date**
+- Date format: YYYY-MM-DD (2009-02-28)
+- ☑ Replace spaces with underscores in FASTA header
+- ☑ Remove spaces before and after values in FASTA header
+
+---
+
+## 🐦 Avian Influenza
+
+> **⚠️ Field Order Auto-Detection:** GISAID avian batch downloads place the **segment BEFORE the subtype** (field order: `Isolate|SEGMENT|SUBTYPE|Date|Accession|Clade`), which is the **reverse** of human influenza downloads. VirSift automatically detects this by checking whether field 2 is a known segment name (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3). No manual configuration is needed — just upload and activate.
+
+**Header structure (avian GISAID batch download):**
+```
+>Isolate_Name|Gene_Segment|Virus_Type/Subtype|Collection_Date|GISAID_Accession|Clade_Assignment
+```
+
+| # | Field | Example | Format |
+|---|-------|---------|--------|
+| 1 | **Isolate Name** | `A/duck/Bangladesh/33676/2017` | A/Host/Location/ID/Year |
+| 2 | **Segment** *(avian batch: segment-first)* | `PA` | HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3 |
+| 3 | **Type / Subtype** | `A_/_H4N6` | `A_/_HxNy` or `A/HxNy` |
+| 4 | **Date** | `2017-09-28` | YYYY-MM-DD, YYYY-MM, YYYY, or unknown |
+| 5 | **Accession** | `EPI_ISL_329573` | EPI_ISL_XXXXXXX |
+| 6 | **Clade** | `6B.1A.5a.2a.1` | Any format, empty, or `unassigned` |
+
+**Valid avian influenza examples:**
+```fasta
+>A/duck/Bangladesh/33676/2017|PA|A_/_H4N6|2017-09-28|EPI_ISL_329573|6B.1A.5a.2a.1
+>A/duck/Tottori/311018/2015|PA|A_/_H3N6|2015-10-01|EPI_ISL_237156|unassigned
+>A/mallard/Republic_of_Georgia/13/2011|PA|A_/_H6N2|2011-11-26|EPI_ISL_189700|
+>A/goose/China/1234/2020|HA|A/H5N1|2020-03|EPI_ISL_400001|2.3.4.4h
+>A/Anas_platyrhynchos/Siberia/42/2023|HA|A_/_H5N1|2023-06-01|EPI_ISL_500123|2.3.4.4b
+>A/common_teal/Italy/1494/2006|HA|A_/_H5N1|2006-11-05|EPI_ISL_100456|2.3.4.4
+```
+
+**Host inference from isolate names:**
+VirSift infers host from the isolate name — no separate header field required:
+- **Latin binomials** (`Anas_platyrhynchos`, `Gallus_gallus`, `Anser_anser`) → matched against `_AVIAN_GENERA` (140+ genera)
+- **Compound English names** (`common_teal`, `mallard_duck`, `domestic_chicken`) → each word matched against `_AVIAN_KW`
+- **Mammalian** (`Sus_scrofa` → Mammalian, `domestic_pig` → Mammalian)
+- **Human influenza** names (`A/Novosibirsk/...`, `A/California/...`) → inferred as Human
+
+**GISAID download settings for Avian Influenza:**
+- Proteins: select segment (e.g., HA, PA, NP)
+- FASTA Header field: **Isolate name | Type | Collection date | Isolate ID | Lineage**
+- Date format: YYYY-MM-DD (2009-02-28)
+- ☑ Replace spaces with underscores in FASTA header
+- ☑ Remove spaces before and after values in FASTA header
+- *Note: Add segment name manually or download each segment separately.*
+
+---
+
+## 🦠 Human Influenza
+
+**Header structure:**
+```
+>Isolate_Name|Virus_Type/Subtype|Gene_Segment|Collection_Date|GISAID_Accession|Clade_Assignment
+```
+
+| # | Field | Examples | Notes |
+|---|-------|----------|-------|
+| 1 | **Strain name** | `A/Novosibirsk/RII-7.429/2024` · `B/Victoria/2/1987` | Full GISAID-style isolate name |
+| 2 | **Type / Subtype** | `A/_H3N2` · `A/_H1N1` · `B` | Flu A uses `A/_HxNx`; Flu B has no subtype — write `B` |
+| 3 | **Segment** | `HA` · `NA` · `PB2` · `PB1` · `PA` · `NP` · `MP` · `NS` · `HE` · `P3` | Any of the 10 influenza gene segments |
+| 4 | **Collection date** | `2024-01-17` · `2009-04-09` · `1987` | ISO 8601 preferred; year-only (`YYYY`) also accepted |
+| 5 | **Accession** | `EPI_ISL_19324838` · `EPI_ISL19324838` | With or without underscore between ISL and digits — both parsed |
+| 6 | **Clade** | `3C.2a1b.2a.2a.3a.1` · `V1A.3a.2` · `6B.1A` | Nextclade / GISAID phylogenetic label |
+
+**Valid human influenza examples:**
+```fasta
+>A/Novosibirsk/RII-7.429/2024|A/_H3N2|NP|2024-01-17|EPI_ISL19324838|3C.2a1b.2a.2a.3a.1
+>B/Novosibirsk/RII-7.893S/2025|B|MP|2025-04-09|EPI_ISL_20154061|V1A.3a.2
+>A/California/07/2009|A/_H1N1|HA|2009-04-09|EPI_ISL_29553|6B.1A
+>B/Victoria/2/1987|B|NA|1987|EPI_ISL_100123|V1A.3a.2
+>A/Hong_Kong/4801/2014|A/_H3N2|PA|2014-03-15|EPI_ISL_200456|3C.2a
+```
+
+**What these examples demonstrate:**
+
+| Observation | Detail |
+|-------------|--------|
+| **Multi-subtype surveillance** | H3N2 (NP, PA), H1N1 (HA), and Flu B (MP, NA) coexist — use Subtype filter to isolate any one |
+| **Multi-segment dataset** | NP, MP, HA, NA, PA all present — use Segment filter before phylogenetic analysis. All 10 segments (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3) are supported |
+| **Year-only date** | `B/Victoria/2/1987` has just `1987` — parsed as Jan 1st 1987; appears correctly in temporal charts |
+| **Accession without underscore** | `EPI_ISL19324838` (no `_` between ISL and digits) — the parser normalises both formats |
+| **Flu B without subtype** | Second field is simply `B` — no H/N designation needed for influenza B |
+| **Multi-decade span** | 1987 → 2025 = 38-year dataset — ideal for Gantt Range chart in Analytics |
+
+**GISAID download settings for Human Influenza:**
+- FASTA Header field: **Isolate name | Type | Collection date | Isolate ID | Lineage**
+- Date format: YYYY-MM-DD (2009-02-28)
+- ☑ Replace spaces with underscores in FASTA header
+- ☑ Remove spaces before and after values in FASTA header
+
+---
+
+---
+
+## 🧬 Alignment Format (.aln-fasta)
+
+VirSift natively accepts **Clustal Omega MSA output** in `.aln-fasta` format.
+These files use the same GISAID pipe-delimited headers, but sequences contain
+alignment gap characters (`-`).
+
+**How VirSift handles alignment files:**
+- Gap characters (`-`) are stripped from every sequence before parsing
+- `sequence_length` and `sequence_hash` are computed on the gap-free sequence
+- All downstream filters, deduplication and analytics work identically to standard FASTA
+
+**Example valid `.aln-fasta` record:**
+```fasta
+>A/California/07/2009|A/_H1N1|HA|2009-04-09|EPI_ISL_29553|6B.1A
+ATGAAAGC----AATTTTTAGT--CTAATTTTG-CTGGTTCTAACATGGCCTCAGAC
+```
+
+**Supported segments in alignment files:** HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3
+
+---
+
+## ⚠️ Common Issues
+
+- **Missing pipes**: If headers use spaces or commas, run the *Header Converter* in Sequence Refinery.
+- **Year-only dates in temporal charts**: Sequences with only `YYYY` dates will cluster at month 1 — expected behaviour.
+- **Blank segments**: Write `||` (empty field) rather than `N/A` — the parser treats "N/A" as a segment name.
+- **Mixed accession formats**: Both `EPI_ISL_12345` and `EPI_ISL12345` are valid; the accession extractor handles both.
+- **HE and P3 segments**: These segments are less common (influenza C/D). VirSift parses them from the header field — no special configuration needed.
+
+> 📄 For the complete format specification, see **1 FASTA Header Format Guide - Complete Reference.pdf** (included in the project download).
+"""
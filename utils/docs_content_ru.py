@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+utils/docs_content_ru.py — Russian long-form blocks for the Documentation page.
+
+Imported lazily by pages/07_📚_Documentation.py for the active language only.
+Plain Markdown strings; keep the four names in step with docs_content_en.py.
+"""
+
+__all__ = ["QUICKSTART", "FEATURE_TABLE", "TIPS_FAQ", "HEADER_FORMAT"]
+
+QUICKSTART = """\
+### Шаг 1 — 📁 Загрузите данные
+Перейдите в **Рабочее пространство** на боковой панели. Нажмите *Загрузка
+файла*, перетащите `.fasta`, `.fa`, `.gz`, `.txt`, `.aln-fasta` или другой
+поддерживаемый файл, дождитесь зелёного баннера успеха.
+
+> **Файлы выравнивания (`.aln-fasta` / `.aln`):** вывод Clustal Omega
+> полностью поддерживается. Символы пропусков (`-`) удаляются автоматически
+> перед вычислением длины и хеша, поэтому вся аналитика остаётся корректной.
+
+### Шаг 2 — ✅ Активируйте набор данных
+Прокрутите до раздела **Загруженные наборы**. Таблица показывает для
+каждого файла количество последовательностей, субтипы, сегменты и диапазон
+дат. Нажмите **⚡ Активировать все** для слияния сразу, или выберите
+конкретные файлы и нажмите **Активировать выбранные**.
+> **Без активации ничего не работает.**
+> **Объединено несколько файлов?** Очиститель, Аналитика и Молекулярная
+> шкала показывают селектор **📁 Scope** — переключайтесь на любой
+> исходный файл для анализа по отдельности.
+
+### Шаг 3 — 🔬 Фильтрация и уточнение
+Перейдите в **Очиститель последовательностей**. Используйте ползунки качества
+(мин./макс. длина, N-серии), фильтры по полям заголовка (субтип, клад, дата,
+хозяин) и интеллектуальный сэмплер HITL.
+
+### Шаг 4 — 📊 Анализ и визуализация
+Откройте **Аналитику** для 10+ типов диаграмм. Используйте **Студию палитры**
+для настройки цветов. В **Молекулярной временной шкале** — анализ устойчивости
+клонов и зимовки. При наличии нескольких исходных файлов все три страницы
+анализа показывают селектор **📁 Scope** — выберите файл для фокусировки
+всех графиков и фильтров.
+
+**Обсерватория** (при наличии активного набора данных) предлагает дашборд
+ключевых метрик и три расширенных визуализации (флажок на боковой панели):
+**диаграмма Санки** (Хозяин → Субтип → Клад), **диаграмма-сосулька**
+(Сегмент → Субтип → Клад) и **3D-разброс** (Год × Длина × Сегмент).
+
+### Шаг 5 — 📋 Экспорт
+Перейдите в **Экспорт** для скачивания итогового FASTA, CSV с метаданными,
+JSON методологии или ZIP-архива. *Разделить и экспортировать* создаёт один
+FASTA-файл на субтип / клад / хозяина автоматически.
+
+> **Структура папок сегментов:** раздел *Структура папок сегментов* создаёт
+> ZIP-архив с папками сегментов (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3).
+> Выберите один из трёх режимов: *Пустые папки (только структура)*,
+> *Заполнить из активного/отфильтрованного датасета*, или *Заполнить из
+> «Разделить и Экспортировать» выше* — третий вариант появляется автоматически
+> при наличии предпросмотра разбивки по сегментам в разделе выше.
+"""
+
+FEATURE_TABLE = """\
+| Страница | Ключевые действия | Примечания |
+|----------|-------------------|-----------|
+| **🌍 Обсерватория** | Дашборд КПЭ (количество, средняя длина, субтипы, диапазон дат); эпидемическая кривая; топ субтипов/хозяев/сегментов/местоположений/кладов; диаграмма Санки, иерархия-сосулька, 3D-разброс (флажок в боковой панели) | Целевая страница без данных; автопереключается в дашборд при активном наборе |
+| **📁 Рабочее пространство** | Загрузка файла (`.fasta` `.fa` `.gz` `.zip` `.aln-fasta`); таблица статистики; Выбрать всё / ⚡ Активировать всё; слияние; **сетка 2×2** (субтипы, сегменты, местоположения, виды-хозяева) после активации | Сначала активируйте; несколько файлов объединяются сразу |
+| **🔬 Очиститель последовательностей** | Мин./макс. длина, N-серии, дедупликация, фильтры по субтипу/кладу/дате/хозяину, сэмплер HITL; **📁 scope по файлу**; рекомендательный блок стратегии; руководство по чувствительности | Scope фокусирует все фильтры на одном исходном файле |
+| **🧬 Молекулярная временная шкала** | Матрица устойчивости клонов, представители по месяцам, диагностика; **📁 scope по файлу**; **🔍 6-мерный фильтр** (сегмент, субтип, хозяин, вид-хозяин, местоположение, клад) | Нужен `sequence_hash`; scope анализирует кластеры каждого файла отдельно |
+| **📊 Аналитика** | 10+ типов диаграмм, палитры, датасет-метрики; **📁 scope по файлу**; **🔍 6-мерный фильтр** (сегмент, субтип, хозяин, вид-хозяин, местоположение, клад) | Фильтры объединяются через И; показываются только нетривиальные измерения |
+| **📋 Экспорт** | FASTA, CSV, JSON, ZIP, список аккессий (.txt), журнал сессии, экспорт по группам; структура папок сегментов с **кнопками быстрого выбора** (Поверхностные, Полимераза, Внутренние), счётчики, README, сводный CSV, превью; **3 режима содержимого** (пустые / из датасета / из «Разделить и Экспортировать»); загрузка по исходным файлам | Обязательно экспортируйте перед закрытием браузера |
+"""
+
+TIPS_FAQ = """\
+### 💡 Советы
+
+| Совет | Подробности |
+|-------|-------------|
+| **Активация — ключ** | Только последовательности из *активированных* наборов участвуют в анализе. |
+| **Большие файлы** | Обработка больших файлов занимает время. Следите за полосой прогресса. |
+| **Кеширование** | Разбор файла кешируется по хешу содержимого. Повторная загрузка одного файла выполняется быстрее. |
+| **Данные сессии** | Все данные хранятся в сессии браузера. Экспортируйте результаты *перед* закрытием вкладки. |
+| **Фильтрованный vs активный** | Большинство страниц используют фильтрованный датасет, если он существует, иначе — полный активный. |
+| **Переключение языка** | Переключайтесь между English и Русским в любое время из боковой панели. |
+| **Пакетная обработка файлов** | Загрузите несколько FASTA-файлов и нажмите **⚡ Активировать все** для мгновенного слияния. После слияния Очиститель, Аналитика и Молекулярная шкала показывают **📁 Scope** — выберите файл для анализа по отдельности. |
+| **Многомерный Scope** | После выбора исходного файла откройте **🔍 Фильтры Scope** в Аналитике или Шкале — до 6 независимых измерений (сегмент, субтип, хозяин, **вид-хозяин**, местоположение, клад). Используйте *Хозяин* для широкой фильтрации (Птицы / Человек), а *Вид-хозяин* — для конкретных птиц (common_teal, Anas_platyrhynchos, duck и т.д.). |
+| **Определение хозяина** | Класс хозяина определяется по **структурному правилу GISAID**: птичьи/животные изоляты всегда имеют 5 частей через косую (`A/ХОЗЯИН/Место/ID/Год`); человеческие — 4 (`A/Место/ID/Год`). Благодаря этому `A/common_teal/Chany/892/2018` (H3N6 птица) никогда не путается с `A/Novosibirsk/RII-7.414/2024` (H3N2 человек). Ключевые слова уточняют класс (Птица/Млекопитающее) по роду и виду. Нераспознанный токен хозяина при ≥5 частях всё равно → Птицы. Столбец `host_species` хранит точный токен вида (слот 1). |
+
+---
+
+### ❓ Часто задаваемые вопросы
+
+**В: Субтипы показываются как "Unknown". Почему?**
+> Парсер ожидает поля в формате GISAID с вертикальной чертой. Если заголовки другого формата — используйте *Конвертер заголовков* в Очистителе.
+
+**В: Матрица Молекулярной временной шкалы пустая.**
+> Требуется столбец `sequence_hash` (добавляется при дедупликации) и хотя бы одна последовательность, встречающаяся в двух и более месяцах. Сначала запустите дедупликацию.
+
+**В: Аналитика показывает "Нет данных" после фильтрации.**
+> Фильтрация могла обнулить датасет. Проверьте счётчик *Активных последовательностей* в боковой панели.
+
+**В: Как экспортировать FASTA-файлы по субтипу?**
+> В Экспорте откройте *Разделить и экспортировать*, выберите **Субтип**, нажмите *Предпросмотр групп*, затем скачайте ZIP.
+
+**В: Я объединил 3 файла, но хочу видеть кластеры/графики каждого файла отдельно.**
+> В **Молекулярной шкале**, **Аналитике** или **Очистителе** найдите селектор
+> **📁 File Scope** в верхней части страницы (отображается только при нескольких
+> исходных файлах). Выберите нужный файл — все графики и фильтры сузятся до его
+> последовательностей. Вернитесь к *All files (merged)* для общего вида.
+
+**В: Как запустить VirSift локально?**
+> Установите зависимости (`pip install -r requirements.txt`) и запустите `streamlit run app.py`. Никакие данные не отправляются на внешние серверы.
+
+**В: В птичьем FASTA сегменты показаны в столбце Субтип, и наоборот — почему?**
+> Выгрузки GISAID для птичьего гриппа используют порядок **сегмент—первый**: `Изолят|СЕГМЕНТ|СУБТИП|Дата|Аккессия|Клад`. Выгрузки для человеческого/B гриппа — порядок субтип—первый. VirSift автоматически определяет порядок по наличию поля 2 в списке известных сегментов.
+
+**В: Почему `Anas_platyrhynchos` (или другое латинское название) показывается как "Unknown"?**
+> Классификатор хозяев распознаёт латинские биномы по роду (первое слово). Убедитесь, что заголовки используют стандартный формат GISAID с подчёркиваниями. Если род отсутствует в базе — сообщите об этом через Issues.
+
+**В: Развёртка 🔍 Scope Filters не отображается в Аналитике — почему?**
+> Развёртка показывается только при наличии хотя бы одного столбца с 2 и более уникальными значениями (исключая "Unknown"). При однородном датасете сначала примените фильтры в Очистителе.
+"""
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Header format — three-virus reference (hRSV | Avian Flu | Human Flu)
+# ─────────────────────────────────────────────────────────────────────────────
+HEADER_FORMAT = """\
+VirSift поддерживает **формат GISAID с вертикальной чертой** для трёх групп вирусов.
+Каждая группа имеет различное количество и порядок полей — выберите тот, который
+соответствует вашей выгрузке из GISAID.
+
+---
+
+## 🫁 РСВ человека (hRSV)
+
+**Структура заголовка:**
+```
+>Isolate_Name|GISAID_Accession|Collection_Date
+```
+
+| № | Поле | Пример | Формат |
+|---|------|--------|--------|
+| 1 | **Название изолята** | `hRSV/B/Argentina/BA-HNRG-206/2016` | hRSV/Субтип/Место/ID/Год |
+| 2 | **Аккессия** | `EPI_ISL_1074181` | EPI_ISL_XXXXXXX |
+| 3 | **Дата сбора** | `2016-04-18` | ГГГГ-ММ-ДД, ГГГГ-ММ, ГГГГ или `unknown` |
+
+**Допустимые примеры hRSV:**
+```fasta
+>hRSV/B/South_Korea/YSU-96B19/un|EPI_ISL_19159645|unknown
+>hRSV/A/Argentina/BA-HNRG-206/2016|EPI_ISL_1074181|2016-04-18
+>RSV/Human/GBR/2023-001|RSV_A|G|2023-11-04|EPI_ISL_17000001|ON1
+```
+
+**Настройки загрузки GISAID для RSV:**
+- Поля заголовка FASTA: **Isolate name | Isolate ID | Collection date**
+- Формат даты: ГГГГ-ММ-ДД
+- ☑ Заменить пробелы на подчёркивания в заголовке FASTA
+- ☑ Удалить пробелы до и после значений
+
+---
+
+## 🐦 Птичий грипп
+
+> **⚠️ Автоопределение порядка полей:** Пакетные выгрузки GISAID для птичьего гриппа ставят **сегмент ДО субтипа** (порядок: `Изолят|СЕГМЕНТ|СУБТИП|Дата|Аккессия|Клад`), что **противоположно** выгрузкам для человеческого гриппа. VirSift автоматически определяет порядок, проверяя, является ли поле 2 известным названием сегмента (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3). Ручная настройка не требуется.
+
+**Структура заголовка (пакетная выгрузка GISAID для птичьего гриппа):**
+```
+>Isolate_Name|Gene_Segment|Virus_Type/Subtype|Collection_Date|GISAID_Accession|Clade_Assignment
+```
+
+| № | Поле | Пример | Формат |
+|---|------|--------|--------|
+| 1 | **Название изолята** | `A/duck/Bangladesh/33676/2017` | A/Хозяин/Место/ID/Год |
+| 2 | **Сегмент** *(птичий: сегмент первый)* | `PA` | HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3 |
+| 3 | **Тип / Субтип** | `A_/_H4N6` | `A_/_HxNy` или `A/HxNy` |
+| 4 | **Дата** | `2017-09-28` | ГГГГ-ММ-ДД, ГГГГ-ММ, ГГГГ или unknown |
+| 5 | **Аккессия** | `EPI_ISL_329573` | EPI_ISL_XXXXXXX |
+| 6 | **Клад** | `6B.1A.5a.2a.1` | Любой формат, пустое или `unassigned` |
+
+**Допустимые примеры птичьего гриппа:**
+```fasta
+>A/duck/Bangladesh/33676/2017|PA|A_/_H4N6|2017-09-28|EPI_ISL_329573|6B.1A.5a.2a.1
+>A/duck/Tottori/311018/2015|PA|A_/_H3N6|2015-10-01|EPI_ISL_237156|unassigned
+>A/mallard/Republic_of_Georgia/13/2011|PA|A_/_H6N2|2011-11-26|EPI_ISL_189700|
+>A/Anas_platyrhynchos/Siberia/42/2023|HA|A_/_H5N1|2023-06-01|EPI_ISL_500123|2.3.4.4b
+>A/common_teal/Italy/1494/2006|HA|A_/_H5N1|2006-11-05|EPI_ISL_100456|2.3.4.4
+```
+
+**Определение хозяина из имени изолята:**
+VirSift определяет хозяина из имени изолята — отдельное поле не нужно:
+- **Латинские биномы** (`Anas_platyrhynchos`, `Gallus_gallus`, `Anser_anser`) → соответствие в `_AVIAN_GENERA` (140+ родов)
+- **Составные английские названия** (`common_teal`, `mallard_duck`, `domestic_chicken`) → каждое слово проверяется по `_AVIAN_KW`
+- **Млекопитающие** (`Sus_scrofa` → Млекопитающее, `domestic_pig` → Млекопитающее)
+
+**Настройки загрузки GISAID для птичьего гриппа:**
+- Белки: выберите сегмент (например, HA, PA, NP)
+- Поля заголовка FASTA: **Isolate name | Type | Collection date | Isolate ID | Lineage**
+- Формат даты: ГГГГ-ММ-ДД
+- ☑ Заменить пробелы на подчёркивания
+- ☑ Удалить пробелы до и после значений
+- *Примечание: добавьте название сегмента вручную или скачивайте каждый сегмент отдельно.*
+
+---
+
+## 🦠 Человеческий грипп
+
+**Структура заголовка:**
+```
+>Isolate_Name|Virus_Type/Subtype|Gene_Segment|Collection_Date|GISAID_Accession|Clade_Assignment
+```
+
+| № | Поле | Примеры | Примечания |
+|---|------|---------|-----------|
+| 1 | **Название штамма** | `A/Novosibirsk/RII-7.429/2024` · `B/Victoria/2/1987` | Полное название изолята в стиле GISAID |
+| 2 | **Тип / Субтип** | `A/_H3N2` · `A/_H1N1` · `B` | Для гриппа А — `A/_HxNx`; для гриппа В — просто `B` |
+| 3 | **Сегмент** | `HA` · `NA` · `PB2` · `PB1` · `PA` · `NP` · `MP` · `NS` · `HE` · `P3` | Любой из 10 генных сегментов гриппа |
+| 4 | **Дата сбора** | `2024-01-17` · `2009-04-09` · `1987` | ISO 8601; только год (`ГГГГ`) тоже принимается |
+| 5 | **Аккессия** | `EPI_ISL_19324838` · `EPI_ISL19324838` | С подчёркиванием и без — оба варианта поддерживаются |
+| 6 | **Клад** | `3C.2a1b.2a.2a.3a.1` · `V1A.3a.2` · `6B.1A` | Метка клада от Nextclade / GISAID |
+
+**Допустимые примеры человеческого гриппа:**
+```fasta
+>A/Novosibirsk/RII-7.429/2024|A/_H3N2|NP|2024-01-17|EPI_ISL19324838|3C.2a1b.2a.2a.3a.1
+>B/Novosibirsk/RII-7.893S/2025|B|MP|2025-04-09|EPI_ISL_20154061|V1A.3a.2
+>A/California/07/2009|A/_H1N1|HA|2009-04-09|EPI_ISL_29553|6B.1A
+>B/Victoria/2/1987|B|NA|1987|EPI_ISL_100123|V1A.3a.2
+>A/Hong_Kong/4801/2014|A/_H3N2|PA|2014-03-15|EPI_ISL_200456|3C.2a
+```
+
+**Что демонстрируют эти примеры:**
+
+| Наблюдение | Подробности |
+|------------|-------------|
+| **Мультисубтипный надзор** | H3N2, H1N1 и грипп B сосуществуют — используйте фильтр Субтип |
+| **Многосегментный датасет** | NP, MP, HA, NA, PA — используйте фильтр Сегмент перед анализом. Все 10 сегментов (HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3) поддерживаются |
+| **Дата только год** | `B/Victoria/2/1987` содержит лишь `1987` — разбирается как 1 января 1987 |
+| **Аккессия без подчёркивания** | `EPI_ISL19324838` — парсер нормализует оба варианта |
+| **Грипп B без субтипа** | Второе поле — просто `B`, без обозначения H/N |
+| **Многодесятилетний охват** | 1987–2025 = 38 лет — идеально для диаграммы Ганта в Аналитике |
+
+**Настройки загрузки GISAID для человеческого гриппа:**
+- Поля заголовка FASTA: **Isolate name | Type | Collection date | Isolate ID | Lineage**
+- Формат даты: ГГГГ-ММ-ДД
+- ☑ Заменить пробелы на подчёркивания
+- ☑ Удалить пробелы до и после значений
+
+---
+
+---
+
+## 🧬 Формат выравнивания (.aln-fasta)
+
+VirSift поддерживает **вывод Clustal Omega MSA** в формате `.aln-fasta`.
+Файлы используют те же заголовки в стиле GISAID с вертикальной чертой, но
+последовательности содержат символы выравнивания (`-`).
+
+**Как VirSift обрабатывает файлы выравнивания:**
+- Символы пропусков (`-`) удаляются из каждой последовательности перед разбором
+- `sequence_length` и `sequence_hash` вычисляются по последовательности без пропусков
+- Все последующие фильтры, дедупликация и аналитика работают идентично стандартному FASTA
+
+**Пример допустимой записи `.aln-fasta`:**
+```fasta
+>A/California/07/2009|A/_H1N1|HA|2009-04-09|EPI_ISL_29553|6B.1A
+ATGAAAGC----AATTTTTAGT--CTAATTTTG-CTGGTTCTAACATGGCCTCAGAC
+```
+
+**Поддерживаемые сегменты в файлах выравнивания:** HA, NA, PB2, PB1, PA, NP, MP, NS, HE, P3
+
+---
+
+## ⚠️ Типичные проблемы
+
+- **Отсутствующие вертикальные черты**: Используйте *Конвертер заголовков* в Очистителе.
+- **Только год в дате**: Последовательности с `ГГГГ` будут кластеризованы в месяце 1 — ожидаемое поведение.
+- **Пустые сегменты**: Пишите `||`, а не "N/A" — парсер воспримет "N/A" как название сегмента.
+- **Смешанные форматы аккессий**: Оба варианта `EPI_ISL_12345` и `EPI_ISL12345` допустимы.
+- **Сегменты HE и P3**: Менее распространены (грипп C/D). VirSift разбирает их из заголовка — специальной настройки не требуется.
+
+> 📄 Полная спецификация — **1 FASTA Header Format Guide - Complete Reference.pdf** (включён в загрузку проекта).
+"""
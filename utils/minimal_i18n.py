@@ -11,7 +11,7 @@ Supports all six United Nations official languages:
 Tier 1 (module-level): JSON files loaded once at import time → available
   the moment any page imports T(), before app.py has even run.
 
-Tier 2 (session-state cache): init_translations() writes a hash-refreshed
+Tier 2 (session-state cache): init_translations() writes an mtime-refreshed
   copy into st.session_state on every app.py run. T() prefers this tier
   so language changes take effect instantly without a server restart.
 
@@ -21,11 +21,16 @@ Lookup order:
   as raw key strings)
 """
 
-import hashlib
 import json
 import os
 import streamlit as st
 
+try:
+    import orjson
+    _ORJSON = True
+except ImportError:
+    _ORJSON = False
+
 # ── Path resolution ──────────────────────────────────────────────────────────
 _UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
 _ROOT_DIR  = os.path.dirname(_UTILS_DIR)
@@ -42,6 +47,9 @@ _LANG_PATHS: dict = {
 # ── Tier 1: module-level load (import-time, once per server process) ─────────
 def _load_json(path: str) -> dict:
     try:
+        if _ORJSON:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
@@ -55,19 +63,23 @@ _MODULE_TRANS: dict = {
 
 
 # ── Tier 2: session-state cache helpers ──────────────────────────────────────
-def _file_md5(path: str) -> str:
-    """Short MD5 of a file — used as a cache-bust discriminator."""
+def _file_stamp(path: str) -> str:
+    """mtime + size of a file — used as a cache-bust discriminator.
+
+    One stat() per file instead of reading and hashing it on every rerun.
+    """
     try:
-        return hashlib.md5(open(path, "rb").read()).hexdigest()[:12]
-    except Exception:
-        return "missing"
+        info = os.stat(path)
+        return f"{info.st_mtime_ns}-{info.st_size};"
+    except OSError:
+        return "missing;"
 
 
 @st.cache_data(show_spinner=False)
 def _load_all_cached(combined_hash: str) -> dict:
     """Cache-data wrapper — re-invoked only when any translation JSON changes.
 
-    combined_hash is a concatenation of all language file MD5s, acting as
+    combined_hash is a concatenation of all language file stamps, acting as
     a single cache-key discriminator.  Body reads files directly from disk.
     """
     del combined_hash  # cache-key only
@@ -77,15 +89,39 @@ def _load_all_cached(combined_hash: str) -> dict:
     }
 
 
+def _resolve_chain(lang: str) -> tuple:
+    """(lang, user_terms, lang_dict, en_dict) from the current session state.
+
+    Tier 2 (session-state) dicts are preferred; the Tier 1 module-level dicts
+    fill in when the session copy is missing or empty.
+    """
+    # Institutional / user-defined overrides
+    user_terms = st.session_state.get("user_terminology", {})
+
+    # Tier 2: session-state dict (preferred — reflects language changes live)
+    sess_trans = st.session_state.get("translations") or {}
+    lang_dict = sess_trans.get(lang) or {}
+    en_dict   = sess_trans.get("en") or {}
+
+    # Tier 1 fallback: module-level dict loaded at import time
+    if not lang_dict:
+        lang_dict = _MODULE_TRANS.get(lang) or {}
+    if not en_dict:
+        en_dict = _MODULE_TRANS.get("en") or {}
+
+    return lang, user_terms, lang_dict, en_dict
+
+
 def init_translations() -> None:
     """Call once in app.py before any T() calls.
 
     Refreshes translations from disk whenever any language JSON file changes,
     without requiring a server restart.  Falls back to the module-level dict
-    on any I/O or JSON error.
+    on any I/O or JSON error.  Also resolves the lookup chain T() uses for
+    the rest of this run (st.session_state["_t_chain"]).
     """
     try:
-        combined = "".join(_file_md5(p) for p in _LANG_PATHS.values())
+        combined = "".join(_file_stamp(p) for p in _LANG_PATHS.values())
         st.session_state["translations"] = _load_all_cached(combined)
     except Exception:
         st.session_state["translations"] = _MODULE_TRANS
@@ -93,6 +129,8 @@ def init_translations() -> None:
     if "language" not in st.session_state:
         st.session_state["language"] = "en"
 
+    st.session_state["_t_chain"] = _resolve_chain(st.session_state["language"])
+
 
 # ── T(): zero-latency lookup with guaranteed English fallback ─────────────────
 def T(key: str, **kwargs) -> str:
@@ -102,6 +140,10 @@ def T(key: str, **kwargs) -> str:
     (supporting partial/stub translations for new languages).  Never returns
     a bare key string when an English translation exists.
 
+    The lookup dicts come from the chain init_translations() resolved for
+    this run, so each call reads session state twice (chain + language)
+    instead of re-resolving every tier; a language change re-resolves.
+
     Args:
         key:      Translation key string.
         **kwargs: Format placeholders, e.g. T('result', count=42).
@@ -111,20 +153,11 @@ def T(key: str, **kwargs) -> str:
           user_terminology override → target language → English → key itself.
     """
     lang = st.session_state.get("language", "en")
-
-    # Institutional / user-defined overrides
-    user_terms = st.session_state.get("user_terminology", {})
-
-    # Tier 2: session-state dict (preferred — reflects language changes live)
-    sess_trans = st.session_state.get("translations") or {}
-    lang_dict = sess_trans.get(lang) or {}
-    en_dict   = sess_trans.get("en") or {}
-
-    # Tier 1 fallback: module-level dict loaded at import time
-    if not lang_dict:
-        lang_dict = _MODULE_TRANS.get(lang) or {}
-    if not en_dict:
-        en_dict = _MODULE_TRANS.get("en") or {}
+    chain = st.session_state.get("_t_chain")
+    if chain is None or chain[0] != lang:
+        chain = _resolve_chain(lang)
+        st.session_state["_t_chain"] = chain
+    _, user_terms, lang_dict, en_dict = chain
 
     # Key lookup: user override → target language → English → key itself
     text = (
@@ -134,7 +167,10 @@ def T(key: str, **kwargs) -> str:
         or key
     )
 
+    # Most labels take no kwargs; and text without "{" formats to itself
+    if not kwargs or "{" not in text:
+        return text
     try:
-        return text.format(**kwargs) if kwargs else text
+        return text.format(**kwargs)
     except (KeyError, ValueError):
         return text
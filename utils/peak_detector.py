@@ -13,6 +13,46 @@ import numpy as np
 import pandas as pd
 
 
+def _as_datetime(dates: pd.Series) -> pd.Series:
+    """*dates* as datetime64 (NaT where unparseable); no-op if already typed."""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    return pd.to_datetime(dates, errors="coerce")
+
+
+def _week_ordinals(dates: pd.Series) -> np.ndarray:
+    """Integer Monday-start week number per datetime64 date.
+
+    Same grouping as .dt.to_period("W") without building a PeriodArray or
+    period strings.  NaT rows get a meaningless value — mask them first.
+    """
+    days = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    # 1970-01-01 was a Thursday: shift by 3 days so weeks start on Monday
+    return (days.astype(np.int64) + 3) // 7
+
+
+def _week_ordinals_of(periods) -> np.ndarray:
+    """Week numbers for "YYYY-MM-DD/YYYY-MM-DD" period strings, as produced
+    by _build_weekly_counts().  Strings in any other form are skipped."""
+    starts = [p[:10] for p in periods if isinstance(p, str) and "/" in p]
+    if not starts:
+        return np.array([], dtype=np.int64)
+    days = np.array(starts, dtype="datetime64[D]")
+    return (days.astype(np.int64) + 3) // 7
+
+
+def _nonzero_counts(ordinals: np.ndarray) -> tuple:
+    """(distinct ordinals ascending, their counts) for a non-empty int array.
+
+    np.bincount over the ordinal range — a dense O(n) count with no hash
+    table, unlike value_counts() on Period values.
+    """
+    lo = ordinals.min()
+    counts = np.bincount(ordinals - lo)
+    present = np.flatnonzero(counts)
+    return present + lo, counts[present]
+
+
 class EpiWaveDetector:
     """Epidemic wave detector using scipy signal processing.
 
@@ -25,6 +65,7 @@ class EpiWaveDetector:
         df: pd.DataFrame,
         sensitivity: float = 0.5,
         min_peak_height: int = 5,
+        dates: pd.Series = None,
     ) -> dict:
         """Find epidemic waves using scipy.signal.find_peaks.
 
@@ -35,6 +76,8 @@ class EpiWaveDetector:
             sensitivity:     0.0–1.0 — controls minimum prominence relative to
                              the median count. Higher = fewer, larger peaks.
             min_peak_height: Absolute minimum sequence count for a peak.
+            dates:           Optional _prepare_datetime(df) result, to skip
+                             re-parsing collection_date.
 
         Returns:
             {
@@ -46,7 +89,7 @@ class EpiWaveDetector:
         """
         from scipy.signal import find_peaks  # lazy import — not on all systems
 
-        ts = self._build_weekly_counts(df)
+        ts = self._build_weekly_counts(df, dates)
         if ts.empty or len(ts) < 3:
             return {"peaks": [], "troughs": [], "wave_count": 0, "ts": ts}
 
@@ -61,9 +104,7 @@ class EpiWaveDetector:
             distance=2,
         )
 
-        trough_indices = self._find_troughs_between_peaks(
-            pd.Series(counts), peak_indices
-        )
+        trough_indices = self._find_troughs_between_peaks(counts, peak_indices)
 
         periods = ts.index.astype(str).tolist()
 
@@ -88,7 +129,10 @@ class EpiWaveDetector:
 
         Performance: operates on aggregated weekly counts, not raw rows. <100ms.
         """
-        wave_analysis = self.detect_epi_waves(df, sensitivity=sensitivity)
+        dates = self._prepare_datetime(df)
+        wave_analysis = self.detect_epi_waves(
+            df, sensitivity=sensitivity, dates=dates
+        )
         candidates = []
 
         # Rank peaks by count descending
@@ -111,7 +155,7 @@ class EpiWaveDetector:
             })
 
         # Off-season clusters
-        for cluster in self._detect_off_season_clusters(df):
+        for cluster in self._detect_off_season_clusters(df, dates):
             candidates.append(cluster)
 
         # Sort by date for display
@@ -131,77 +175,107 @@ class EpiWaveDetector:
         if df.empty or "collection_date" not in df.columns:
             return df.head(0)
 
-        df = df.copy()
-        df["_period"] = (
-            pd.to_datetime(df["collection_date"], errors="coerce")
-            .dt.to_period("W")
-            .astype(str)
-        )
-
-        selected_periods = set()
-        for period, _ in wave_analysis.get("peaks", []):
-            selected_periods.add(period)
-        for period, _ in wave_analysis.get("troughs", []):
-            selected_periods.add(period)
-
-        reps = []
+        selected_periods = [p for p, _ in wave_analysis.get("peaks", [])]
+        selected_periods += [p for p, _ in wave_analysis.get("troughs", [])]
 
         # First and last sequence overall (temporal bookends)
-        valid = df.dropna(subset=["collection_date"])
-        if not valid.empty:
-            reps.append(valid.iloc[0])
-            if len(valid) > 1:
-                reps.append(valid.iloc[-1])
-
-        # One representative per selected period (first occurrence)
-        for period in selected_periods:
-            subset = df[df["_period"] == period]
-            if not subset.empty:
-                reps.append(subset.iloc[0])
-
-        if not reps:
+        present = np.flatnonzero(df["collection_date"].notna().to_numpy())
+        positions = [present[[0, -1]] if len(present) > 1 else present]
+
+        # One representative per selected period (first occurrence): a
+        # single pass over week numbers instead of one scan per period
+        dates = _as_datetime(df["collection_date"])
+        weeks = _week_ordinals(dates)
+        hit = np.flatnonzero(
+            dates.notna().to_numpy()
+            & np.isin(weeks, _week_ordinals_of(selected_periods))
+        )
+        _, first = np.unique(weeks[hit], return_index=True)
+        positions.append(hit[first])
+
+        positions = np.concatenate(positions)
+        if not len(positions):
             return df.head(0)
 
-        result = pd.DataFrame(reps).drop(columns=["_period"], errors="ignore")
+        # One positional gather — no list of row Series to rebox
+        result = df.iloc[positions]
         return result.drop_duplicates(
             subset=["sequence_hash"] if "sequence_hash" in result.columns else None
         ).reset_index(drop=True)
 
-    def _build_weekly_counts(self, df: pd.DataFrame) -> pd.Series:
-        """Aggregate sequence counts by ISO week period.
+    def select_weeks(self, df: pd.DataFrame, periods) -> pd.DataFrame:
+        """Rows of df whose collection_date falls in any of the given week
+        period strings (the _build_weekly_counts() index format).
 
-        Returns a pd.Series with string period index, sorted by time.
+        Matches on integer week numbers rather than a per-row period-string
+        column, so df is neither copied nor widened.  Row order is kept.
         """
         if df.empty or "collection_date" not in df.columns:
-            return pd.Series(dtype=int)
+            return df.head(0)
 
-        dates = pd.to_datetime(df["collection_date"], errors="coerce").dropna()
+        dates = _as_datetime(df["collection_date"])
+        hit = dates.notna().to_numpy() & np.isin(
+            _week_ordinals(dates), _week_ordinals_of(periods)
+        )
+        return df[hit]
+
+    def _prepare_datetime(self, df: pd.DataFrame) -> pd.Series:
+        """collection_date parsed to datetime64, unparseable rows dropped.
+
+        Parse once and pass the result to the aggregation helpers below
+        when more than one of them runs on the same frame.
+        """
+        if df.empty or "collection_date" not in df.columns:
+            return pd.Series(dtype="datetime64[ns]")
+        return _as_datetime(df["collection_date"]).dropna()
+
+    def _build_weekly_counts(
+        self, df: pd.DataFrame, dates: pd.Series = None
+    ) -> pd.Series:
+        """Aggregate sequence counts by ISO week period.
+
+        Returns a pd.Series with string period index, sorted by time.
+        """
+        if dates is None:
+            dates = self._prepare_datetime(df)
         if dates.empty:
             return pd.Series(dtype=int)
 
-        week_periods = dates.dt.to_period("W")
-        counts = week_periods.value_counts().sort_index()
-        counts.index = counts.index.astype(str)
-        return counts
+        weeks, counts = _nonzero_counts(_week_ordinals(dates))
+        starts = (weeks * 7 - 3).astype("datetime64[D]")
+        labels = [
+            f"{start}/{end}"
+            for start, end in zip(
+                np.datetime_as_string(starts), np.datetime_as_string(starts + 6)
+            )
+        ]
+        return pd.Series(
+            counts, index=pd.Index(labels, dtype=object, name=dates.name),
+            name="count",
+        )
 
     def _find_troughs_between_peaks(
-        self, temporal_counts: pd.Series, peaks: np.ndarray
+        self, temporal_counts: np.ndarray, peaks: np.ndarray
     ) -> np.ndarray:
-        """Identify local minima between consecutive detected peaks."""
+        """Identify local minima between consecutive detected peaks.
+
+        Works on the raw counts array: one argmin over a view per peak pair,
+        no Series slicing.
+        """
         if len(peaks) < 2:
             return np.array([], dtype=int)
 
-        troughs = []
-        for i in range(len(peaks) - 1):
-            start, end = peaks[i], peaks[i + 1]
-            segment = temporal_counts.iloc[start:end + 1]
-            if len(segment) > 2:
-                local_min_offset = int(segment.iloc[1:-1].values.argmin()) + 1
-                troughs.append(start + local_min_offset)
-
+        counts = np.asarray(temporal_counts)
+        troughs = [
+            start + 1 + int(counts[start + 1:end].argmin())
+            for start, end in zip(peaks[:-1].tolist(), peaks[1:].tolist())
+            if end - start > 1
+        ]
         return np.array(troughs, dtype=int)
 
-    def _detect_off_season_clusters(self, df: pd.DataFrame) -> list:
+    def _detect_off_season_clusters(
+        self, df: pd.DataFrame, dates: pd.Series = None
+    ) -> list:
         """Find statistically anomalous off-season sequence clusters.
 
         Uses IQR-based outlier detection on monthly sequence counts.
@@ -210,29 +284,31 @@ class EpiWaveDetector:
 
         Returns list of peak-descriptor dicts with type='Off-Season Cluster'.
         """
-        if df.empty or "collection_date" not in df.columns:
-            return []
-
-        dates = pd.to_datetime(df["collection_date"], errors="coerce").dropna()
+        if dates is None:
+            dates = self._prepare_datetime(df)
         if dates.empty:
             return []
 
-        monthly = dates.dt.to_period("M").value_counts().sort_index()
-        if len(monthly) < 4:
+        months, counts = _nonzero_counts(
+            dates.to_numpy(dtype="datetime64[ns]")
+            .astype("datetime64[M]").astype(np.int64)
+        )
+        if len(counts) < 4:
             return []
 
-        q1  = float(monthly.quantile(0.25))
-        q3  = float(monthly.quantile(0.75))
+        q1, q3 = np.quantile(counts, [0.25, 0.75])
         iqr = q3 - q1
         low_threshold = max(1, q1 - 1.5 * iqr)
 
-        clusters = []
-        for period, count in monthly.items():
-            if 0 < count <= low_threshold:
-                clusters.append({
-                    "date":  str(period),
-                    "count": int(count),
-                    "type":  "Off-Season Cluster",
-                    "rank":  None,
-                })
-        return clusters
+        # counts only holds non-empty months, so every flagged month is > 0
+        flagged = np.flatnonzero(counts <= low_threshold)
+        labels = np.datetime_as_string(months[flagged].astype("datetime64[M]"))
+        return [
+            {
+                "date":  str(label),
+                "count": int(count),
+                "type":  "Off-Season Cluster",
+                "rank":  None,
+            }
+            for label, count in zip(labels, counts[flagged])
+        ]
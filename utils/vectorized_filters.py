@@ -10,9 +10,35 @@ Supported operators: contains, equals, not_equals, starts_with, regex, in_list,
 
 import re
 
+import numpy as np
 import pandas as pd
 
 
+def _search_mask(text: pd.Series, pattern: str, literal: bool) -> pd.Series:
+    """Case-insensitive re.search of *pattern* over a column of str.
+
+    Same matches as text.str.contains(pattern, case=False), but the pattern
+    is compiled once and scanned directly, without the pandas per-element
+    wrapper.  A *literal* ASCII pattern is checked with a plain substring
+    test on lowercased ASCII values, where lower() and re.IGNORECASE agree;
+    any other value goes through the compiled pattern.  Raises re.error for
+    an invalid pattern.
+    """
+    regex = re.compile(re.escape(pattern) if literal else pattern, re.IGNORECASE)
+    values = text.to_numpy(dtype=object)
+    if literal and pattern.isascii():
+        needle = pattern.lower()
+        hits = (
+            (needle in v.lower()) if v.isascii() else (regex.search(v) is not None)
+            for v in values
+        )
+    else:
+        hits = (regex.search(v) is not None for v in values)
+    return pd.Series(
+        np.fromiter(hits, dtype=bool, count=len(values)), index=text.index
+    )
+
+
 class VectorizedFilterEngine:
     """Boolean mask filter combinator for GISAID sequence DataFrames.
 
@@ -32,6 +58,19 @@ class VectorizedFilterEngine:
         "date_range":  "pair",   # value=[start, end] as pd.Timestamp
     }
 
+    # Relative cost per row, for rule evaluation order: per-distinct
+    # comparisons < single scans < regex scans
+    _RULE_COST = {
+        "equals":       0,
+        "not_equals":   0,
+        "in_list":      0,
+        "starts_with":  1,
+        "date_range":   1,
+        "contains":     2,
+        "not_contains": 2,
+        "regex":        2,
+    }
+
     def apply_header_component_filters(
         self, df: pd.DataFrame, filter_rules: list
     ) -> pd.DataFrame:
@@ -50,10 +89,23 @@ class VectorizedFilterEngine:
         if df.empty or not filter_rules:
             return df
 
-        # Start with all-True mask
-        mask = pd.Series(True, index=df.index)
-
-        for rule in filter_rules:
+        # Cheap rules first; once under a quarter of the rows in play survive,
+        # later rules only see the survivors.  Date parsing and datetime-to-str
+        # formatting depend on the whole column, so rules that would do
+        # either keep evaluating on the full column.
+        rules = sorted(
+            filter_rules,
+            key=lambda r: self._RULE_COST.get(r.get("operator", "equals"), 2),
+        )
+        rows = None                           # positions in play; None = all
+        keep = np.ones(len(df), dtype=bool)   # mask over the rows in play
+        # Per-field str conversions and date parses, shared by every rule on
+        # the same column; full_cache holds whole-column values and is kept
+        # across narrowing, so each date column is parsed once per call
+        text_cache: dict = {}
+        full_cache: dict = {}
+
+        for rule in rules:
             field    = rule.get("field", "")
             operator = rule.get("operator", "equals")
             value    = rule.get("value")
@@ -62,11 +114,32 @@ class VectorizedFilterEngine:
                 continue  # Skip unknown fields silently
 
             col = df[field]
-            rule_mask = self._build_mask(col, operator, value, field)
-            if rule_mask is not None:
-                mask &= rule_mask
+            if operator == "date_range" or (
+                rows is not None and pd.api.types.is_datetime64_any_dtype(col)
+            ):
+                rule_mask = self._build_mask(col, operator, value, field, full_cache)
+                if rule_mask is not None and rows is not None:
+                    rule_mask = rule_mask.iloc[rows]
+            elif rows is None:
+                rule_mask = self._build_mask(col, operator, value, field, text_cache)
+            else:
+                rule_mask = self._build_mask(
+                    col.iloc[rows], operator, value, field, text_cache
+                )
+            if rule_mask is None:
+                continue
 
-        return df[mask].copy()
+            keep &= rule_mask.to_numpy(dtype=bool)
+            kept = int(np.count_nonzero(keep))
+            if kept < len(keep) // 4:
+                rows = np.flatnonzero(keep) if rows is None else rows[keep]
+                keep = np.ones(kept, dtype=bool)
+                text_cache.clear()  # cached columns are the old length
+                if not kept:
+                    break
+
+        selected = np.flatnonzero(keep) if rows is None else rows[keep]
+        return df.iloc[selected].copy()
 
     # ------------------------------------------------------------------
     # Individual operator helpers
@@ -78,50 +151,141 @@ class VectorizedFilterEngine:
         operator: str,
         value,
         field: str,
+        text_cache: dict = None,
     ) -> "pd.Series | None":
-        """Build a boolean mask for one filter rule."""
+        """Build a boolean mask for one filter rule.
+
+        text_cache: optional dict shared across rules — see _column_text().
+        """
 
         if operator == "equals":
-            return col.astype(str).str.strip() == str(value).strip()
+            target = str(value).strip()
+            return self._match_distinct(
+                col, field, text_cache, lambda text: text == target
+            )
 
         if operator == "not_equals":
-            return col.astype(str).str.strip() != str(value).strip()
+            target = str(value).strip()
+            return self._match_distinct(
+                col, field, text_cache, lambda text: text != target
+            )
 
         if operator == "contains":
-            return col.astype(str).str.contains(
-                re.escape(str(value)), case=False, na=False
+            return _search_mask(
+                self._column_text(col, field, False, text_cache), str(value), True
             )
 
         if operator == "not_contains":
-            return ~col.astype(str).str.contains(
-                re.escape(str(value)), case=False, na=False
+            return ~_search_mask(
+                self._column_text(col, field, False, text_cache), str(value), True
             )
 
         if operator == "starts_with":
-            return col.astype(str).str.startswith(str(value), na=False)
+            return self._column_text(col, field, False, text_cache).str.startswith(
+                str(value), na=False
+            )
 
         if operator == "regex":
             try:
-                return col.astype(str).str.contains(
-                    str(value), case=False, na=False, regex=True
+                return _search_mask(
+                    self._column_text(col, field, False, text_cache), str(value), False
                 )
             except re.error:
                 return None  # Invalid regex — skip rule
 
         if operator == "in_list":
             values = [str(v).strip() for v in (value or [])]
-            return col.astype(str).str.strip().isin(values)
+            return self._match_distinct(
+                col, field, text_cache, lambda text: text.isin(values)
+            )
 
         if operator == "date_range":
             try:
                 start, end = value[0], value[1]
-                dates = pd.to_datetime(col, errors="coerce")
+                dates = self._column_dates(col, field, text_cache)
                 return (dates >= pd.Timestamp(start)) & (dates <= pd.Timestamp(end))
             except Exception:
                 return None
 
         return None  # Unknown operator
 
+    def _column_text(
+        self, col: pd.Series, field: str, strip: bool, cache: dict = None
+    ) -> pd.Series:
+        """col.astype(str), whitespace-stripped when *strip* is set.
+
+        Memoised per (field, strip) in *cache*, so several rules on the same
+        column convert it once; the stripped form reuses the unstripped one.
+        """
+        if cache is None:
+            cache = {}
+        key = (field, strip)
+        if key not in cache:
+            cache[key] = (
+                self._column_text(col, field, False, cache).str.strip()
+                if strip else col.astype(str)
+            )
+        return cache[key]
+
+    def _column_dates(
+        self, col: pd.Series, field: str, cache: dict = None
+    ) -> pd.Series:
+        """pd.to_datetime(col, errors="coerce"), memoised per field in *cache*."""
+        if cache is None:
+            cache = {}
+        key = (field, "dates")
+        if key not in cache:
+            cache[key] = pd.to_datetime(col, errors="coerce")
+        return cache[key]
+
+    def _match_distinct(
+        self, col: pd.Series, field: str, cache: dict, predicate,
+        strip: bool = True,
+    ) -> pd.Series:
+        """predicate(str values, stripped when *strip* is set) evaluated once
+        per distinct value.
+
+        Most filter columns are low-cardinality (subtype, host, segment,
+        clade), so the column is factorized once per call (memoised in
+        *cache*), the predicate runs on its distinct values and the result
+        is broadcast back through the codes.  Falls back to the whole str
+        column when the first rows already look mostly unique
+        (accession, isolate — factorizing would not pay for itself), and for
+        object columns holding non-str values: factorize merges 1 and 1.0,
+        which stringify differently.
+        """
+        if cache is None:
+            cache = {}
+        key = (field, "distinct")
+        if key not in cache:
+            head = col.iloc[:1000]
+            if head.nunique() > len(head) // 2:
+                cache[key] = None
+            else:
+                codes, uniques = pd.factorize(col)
+                if col.dtype == object and pd.api.types.infer_dtype(
+                    uniques
+                ) not in ("string", "empty"):
+                    cache[key] = None
+                else:
+                    cache[key] = (codes, pd.Series(uniques).astype(str))
+
+        if cache[key] is None:
+            return predicate(self._column_text(col, field, strip, cache))
+
+        codes, text = cache[key]
+        if strip:
+            text = text.str.strip()
+        # Code -1 marks missing values; they take the appended slot for now
+        mask = np.append(predicate(text).to_numpy(dtype=bool), False)[codes]
+        missing = codes < 0
+        if missing.any():
+            text = col[missing].astype(str)
+            if strip:
+                text = text.str.strip()
+            mask[missing] = predicate(text).to_numpy(dtype=bool)
+        return pd.Series(mask, index=col.index)
+
     # ------------------------------------------------------------------
     # Field discovery
     # ------------------------------------------------------------------
@@ -138,22 +302,29 @@ class VectorizedFilterEngine:
             return {}
 
         result = {}
-        sample = df.head(sample_size) if len(df) > sample_size else df
 
         for col in df.columns:
             if col in ("sequence", "sequence_hash"):
                 continue  # Never filter-UI candidates
 
-            non_null = df[col].replace({"Unknown": None, "": None}).dropna()
-            populated_pct = 100 * len(non_null) / len(df)
+            # One factorize per column gives nulls (code -1), the distinct
+            # count and, via the distinct values, the placeholder rows —
+            # instead of a replace() copy, a notna() scan and a nunique()
+            values = df[col]
+            codes, uniques = pd.factorize(values)
+            real = np.ones(len(uniques), dtype=bool)
+            if values.dtype.kind not in "biufcmM":
+                # Placeholders are str: only non-numeric, non-datetime
+                # columns can hold them
+                real = ~pd.Index(uniques).isin(("Unknown", ""))
+            populated = np.append(real, False)[codes]
+            populated_pct = 100 * int(np.count_nonzero(populated)) / len(df)
 
             if populated_pct < 10:
                 continue
 
             sample_vals = (
-                sample[col]
-                .replace({"Unknown": None, "": None})
-                .dropna()
+                values.iloc[:sample_size][populated[:sample_size]]
                 .astype(str)
                 .unique()[:5]
                 .tolist()
@@ -161,7 +332,7 @@ class VectorizedFilterEngine:
 
             result[col] = {
                 "populated_pct": round(populated_pct, 1),
-                "n_unique":      int(df[col].nunique()),
+                "n_unique":      len(uniques),
                 "sample_values": sample_vals,
             }
 
@@ -188,13 +359,21 @@ class VectorizedFilterEngine:
             col_name = f"clade_l{level}"
             if col_name not in df.columns:
                 return df
-            mask = df[col_name].astype(str) == clade_pattern
+            mask = self._match_distinct(
+                df[col_name], col_name, None,
+                lambda text: text == clade_pattern, strip=False,
+            )
         else:
             # Match against the raw clade column (prefix)
             clade_col = "clade" if "clade" in df.columns else None
             if clade_col is None:
                 return df
-            mask = df[clade_col].astype(str).str.startswith(clade_pattern, na=False)
+            # Few distinct clades: test the prefix once per clade, not per row
+            mask = self._match_distinct(
+                df[clade_col], clade_col, None,
+                lambda text: text.str.startswith(clade_pattern, na=False),
+                strip=False,
+            )
 
         return df[mask].copy()
 
@@ -234,9 +413,20 @@ class VectorizedFilterEngine:
         """Remove sequences containing a run of N >= max_n_run."""
         if "sequence" not in df.columns:
             return df
-        pattern = "N" * max_n_run
-        mask = ~df["sequence"].str.contains(pattern, case=False, na=False)
-        return df[mask].copy()
+        run = "N" * max_n_run
+        # Case-insensitive match as a plain substring test: "n" is the only
+        # character re.IGNORECASE pairs with "N", so fold it first when present
+        values = df["sequence"].to_numpy(dtype=object)
+        has_run = np.fromiter(
+            (
+                isinstance(seq, str)
+                and run in (seq.replace("n", "N") if "n" in seq else seq)
+                for seq in values
+            ),
+            dtype=bool,
+            count=len(values),
+        )
+        return df[~has_run].copy()
 
     def deduplicate(
         self, df: pd.DataFrame, mode: str = "sequence"